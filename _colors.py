@@ -0,0 +1,26 @@
+"""
+Shared ANSI color codes for the installer scripts.
+
+Plain module-level constants rather than a class, so each use is a
+single global lookup instead of a class attribute lookup. They are
+empty strings when stdout is not a terminal or NO_COLOR is set
+(https://no-color.org), so redirected output carries no escape codes.
+"""
+
+import os
+import sys
+from typing import Final
+
+USE_COLOR: Final = bool(sys.stdout and sys.stdout.isatty() and not os.environ.get("NO_COLOR"))
+
+def _code(escape):
+    return escape if USE_COLOR else ''
+
+HEADER: Final = _code('\033[95m')
+BLUE: Final = _code('\033[94m')
+CYAN: Final = _code('\033[96m')
+GREEN: Final = _code('\033[92m')
+YELLOW: Final = _code('\033[93m')
+RED: Final = _code('\033[91m')
+ENDC: Final = _code('\033[0m')
+BOLD: Final = _code('\033[1m')
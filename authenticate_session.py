@@ -7,82 +7,292 @@ Run this script locally to ensure your session file is properly authenticated.
 
 Usage:
     python authenticate_session.py
+    python authenticate_session.py --string-session   # print a StringSession, no .session file
 """
 
 import os
+import sys
+import atexit
+import argparse
+import getpass
+import json
+import signal
 import asyncio
 import logging
+import logging.handlers
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
 from telethon import TelegramClient
-from dotenv import load_dotenv
+from telethon.errors import RPCError, SessionPasswordNeededError
+from telethon.sessions import SQLiteSession, StringSession
+from telethon.tl.functions.updates import GetStateRequest
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from .env unless the platform already injected them
+if not os.getenv('TELEGRAM_API_ID'):
+    from dotenv import load_dotenv
+    load_dotenv()
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging - records are buffered and written in one batch per run
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_buffer = logging.handlers.MemoryHandler(capacity=64, flushLevel=logging.ERROR, target=_log_stream)
+logging.basicConfig(level=logging.INFO, handlers=[_log_buffer])
 logger = logging.getLogger(__name__)
 
-async def authenticate_session():
+@dataclass(frozen=True, slots=True)
+class Credentials:
+    """Telegram credentials read from the environment"""
+    api_id: int
+    api_hash: str
+    phone: str
+    session_name: str
+
+@lru_cache(maxsize=1)
+def _read_credentials() -> Credentials:
+    """Read and validate Telegram credentials; only a successful read is cached"""
+    api_id = os.getenv('TELEGRAM_API_ID')
+    api_hash = os.getenv('TELEGRAM_API_HASH')
+    phone_number = os.getenv('TELEGRAM_PHONE_NUMBER')
+    session_name = os.getenv('TELEGRAM_SESSION_NAME', 'daredevil_session')
+    
+    required = {
+        'TELEGRAM_API_ID': api_id,
+        'TELEGRAM_API_HASH': api_hash,
+        'TELEGRAM_PHONE_NUMBER': phone_number,
+    }
+    missing = [name for name, value in required.items() if not value]
+    if missing:
+        raise LookupError(missing)
+    
+    return Credentials(
+        api_id=int(api_id),
+        api_hash=api_hash,
+        phone=phone_number,
+        session_name=session_name,
+    )
+
+def load_credentials() -> Optional[Credentials]:
+    """Telegram credentials from the environment; None if any are missing"""
+    try:
+        return _read_credentials()
+    except LookupError as e:
+        logger.error("❌ Missing required environment variables: %s", ", ".join(e.args[0]))
+        return None
+
+class WALSQLiteSession(SQLiteSession):
+    """SQLite session file opened in WAL mode to cut fsyncs on auth-key updates"""
+    
+    def _cursor(self):
+        fresh = self._conn is None
+        cursor = super()._cursor()
+        if fresh:
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+        return cursor
+
+def _dc_cache_path(session_name: str) -> Path:
+    return Path(f"{session_name}.dc.json")
+
+def _apply_cached_dc(session, session_name: str):
+    """Point a fresh session at the last known home DC to avoid a migrate round trip"""
+    if session.auth_key is not None:
+        return  # Session already knows its DC
+    try:
+        dc = json.loads(_dc_cache_path(session_name).read_text(encoding='utf-8'))
+        session.set_dc(dc['dc_id'], dc['ip'], dc['port'])
+    except (OSError, ValueError, KeyError):
+        pass
+
+def _save_cached_dc(session, session_name: str):
+    """Remember the DC this session ended up on"""
+    dc = {'dc_id': session.dc_id, 'ip': session.server_address, 'port': session.port}
+    try:
+        _dc_cache_path(session_name).write_text(json.dumps(dc), encoding='utf-8')
+    except OSError as e:
+        logger.warning(f"⚠️ Could not cache DC address: {e}")
+
+# Upper bound for the post-login verification round trip (seconds)
+PROBE_TIMEOUT = 10.0
+
+# Shared client per event loop so repeated checks reuse one live MTProto
+# connection; a client (and its lock) only works on the loop that made it
+_clients = {}
+_client_locks = {}
+
+def _client_lock(loop) -> asyncio.Lock:
+    # Forget clients whose loop has been closed under us
+    for stale in [l for l in _client_locks if l.is_closed()]:
+        _client_locks.pop(stale, None)
+        _clients.pop(stale, None)
+    return _client_locks.setdefault(loop, asyncio.Lock())
+
+async def _prompt(message: str, secret: bool = False) -> str:
+    """Read a line from stdin without blocking the event loop"""
+    _log_buffer.flush()  # show pending log lines before the prompt
+    reader = getpass.getpass if secret else input
+    return await asyncio.get_running_loop().run_in_executor(None, reader, message)
+
+async def _sign_in(client, phone_number):
+    """Interactive login over an already-connected client"""
+    await client.send_code_request(phone_number)
+    code = await _prompt("📨 Enter the code Telegram sent you: ")
+    try:
+        await client.sign_in(phone_number, code.strip())
+    except SessionPasswordNeededError:
+        password = await _prompt("🔒 Two-step verification password: ", secret=True)
+        await client.sign_in(password=password)
+
+async def get_client(creds: Credentials, string_session: bool = False):
+    """Return the cached TelegramClient, connecting it on first use
+    
+    With string_session the auth key is kept in memory only: no .session
+    file, and no DC cache file either.
+    """
+    loop = asyncio.get_running_loop()
+    async with _client_lock(loop):
+        client = _clients.get(loop)
+        if client is None:
+            if string_session:
+                session = StringSession()
+            else:
+                session = WALSQLiteSession(creds.session_name)
+                _apply_cached_dc(session, creds.session_name)
+            client = TelegramClient(session, creds.api_id, creds.api_hash)
+            try:
+                await client.connect()
+                # Fast path: a session with valid auth keys skips the login dance
+                if await client.is_user_authorized():
+                    logger.info("♻️ Existing session is already authorized - skipping login")
+                else:
+                    logger.info("🔑 Session not authorized - starting login")
+                    await _sign_in(client, creds.phone)
+            except BaseException:
+                # Never leave a half-open socket/session file behind (incl. Ctrl+C)
+                await client.disconnect()
+                raise
+            if not string_session:
+                _save_cached_dc(client.session, creds.session_name)
+            _clients[loop] = client
+        elif not client.is_connected():
+            await client.connect()
+        return client
+
+async def close_client():
+    """Disconnect this loop's cached client if one is open"""
+    loop = asyncio.get_running_loop()
+    _client_locks.pop(loop, None)
+    client = _clients.pop(loop, None)
+    if client is not None:
+        await client.disconnect()
+
+def _shutdown_client():
+    """Disconnect the cached clients on process shutdown"""
+    for loop in list(_clients):
+        try:
+            if not loop.is_closed() and not loop.is_running():
+                loop.run_until_complete(close_client())
+        except Exception as e:
+            logger.warning(f"⚠️ Error disconnecting client: {e}")
+
+async def authenticate_session(string_session: bool = False):
     """Authenticate Telegram session locally"""
+    # Get credentials from environment (bad values should fail loudly)
+    creds = load_credentials()
+    if creds is None:
+        _log_buffer.flush()
+        return False
+    
     try:
-        # Get credentials from environment
-        api_id = os.getenv('TELEGRAM_API_ID')
-        api_hash = os.getenv('TELEGRAM_API_HASH')
-        phone_number = os.getenv('TELEGRAM_PHONE_NUMBER')
-        session_name = os.getenv('TELEGRAM_SESSION_NAME', 'daredevil_session')
-        
-        if not all([api_id, api_hash, phone_number]):
-            logger.error("❌ Missing required environment variables:")
-            logger.error("   - TELEGRAM_API_ID")
-            logger.error("   - TELEGRAM_API_HASH") 
-            logger.error("   - TELEGRAM_PHONE_NUMBER")
-            return False
+        # Dial the DC in the background while the banner is written
+        client_task = asyncio.create_task(get_client(creds, string_session))
         
         logger.info("🔐 Starting Telegram session authentication...")
-        logger.info(f"📱 Phone: {phone_number}")
-        logger.info(f"📄 Session file: {session_name}.session")
-        
-        # Create client
-        client = TelegramClient(session_name, int(api_id), api_hash)
-        
-        # Start client (this will prompt for authentication if needed)
-        await client.start(phone=phone_number)
-        
-        # Get user info to verify authentication
-        me = await client.get_me()
-        logger.info(f"✅ Authentication successful!")
-        logger.info(f"👤 Logged in as: {me.first_name} {me.last_name or ''}")
-        logger.info(f"🆔 User ID: {me.id}")
-        
-        # Test connection
-        await client.get_dialogs(limit=1)
-        logger.info("🌐 Connection test successful!")
-        
-        # Disconnect
-        await client.disconnect()
-        logger.info("📄 Session file saved and ready for deployment!")
+        logger.info(f"📱 Phone: {creds.phone}")
+        if string_session:
+            logger.info("📄 Session storage: in-memory StringSession")
+        else:
+            logger.info(f"📄 Session file: {creds.session_name}.session")
         
-        return True
+        # Wait for the connected client - prompts for authentication if needed
+        client = await client_task
         
-    except Exception as e:
-        logger.error(f"❌ Authentication failed: {e}")
+        # Verify authentication and test the connection in one pipelined round
+        # trip; GetStateRequest is a minimal probe (no dialog materialization)
+        me, state = await asyncio.wait_for(
+            asyncio.gather(client.get_me(), client(GetStateRequest())),
+            timeout=PROBE_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        logger.error(f"⏱️ AUTH_PROBE_TIMEOUT: Telegram did not answer within {PROBE_TIMEOUT:.0f}s")
         return False
+    except (RPCError, ConnectionError, OSError):
+        logger.exception("❌ Authentication failed")
+        return False
+    except Exception:
+        logger.exception("❌ Unexpected error during authentication")
+        return False
+    finally:
+        _log_buffer.flush()
+    
+    logger.info(f"✅ Authentication successful!")
+    logger.info(f"👤 Logged in as: {me.first_name} {me.last_name or ''}")
+    logger.info(f"🆔 User ID: {me.id}")
+    logger.info(f"🌐 Connection test successful! (pts: {state.pts})")
+    
+    # Client stays connected for reuse; it is disconnected on shutdown
+    if string_session:
+        print("\n🔑 TELEGRAM_STRING_SESSION value:")
+        print(client.session.save())
+        logger.info("📄 StringSession ready - set it as TELEGRAM_STRING_SESSION on Railway!")
+    else:
+        logger.info("📄 Session file saved and ready for deployment!")
+    
+    _log_buffer.flush()
+    return True
 
 async def main():
     """Main function"""
     print("🚀 Agent Daredevil - Session Authentication Helper")
     print("=" * 50)
     
-    success = await authenticate_session()
+    parser = argparse.ArgumentParser(description="Authenticate the Telegram session for deployment")
+    parser.add_argument('--string-session', action='store_true',
+                        help='Authenticate in memory and print a StringSession instead of writing a .session file')
+    args = parser.parse_args()
+    
+    success = await authenticate_session(string_session=args.string_session)
     
     if success:
         print("\n🎉 Session authentication completed successfully!")
         print("📦 You can now deploy to Railway with confidence.")
-        print("💡 The session file will be used for authentication in Docker.")
+        if args.string_session:
+            print("💡 Set TELEGRAM_STRING_SESSION on Railway; no session file is needed in Docker.")
+        else:
+            print("💡 The session file will be used for authentication in Docker.")
     else:
         print("\n❌ Session authentication failed!")
         print("💡 Please check your environment variables and try again.")
         print("💡 Make sure you have a valid .env file with Telegram credentials.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Registered here rather than at import so importers keep their own
+    # SIGTERM handling (and importing off the main thread still works)
+    atexit.register(_shutdown_client)
+    # Turn SIGTERM into a normal exit so the atexit hook gets to disconnect
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    
+    # Faster event loop for the MTProto handshake when available (Linux/macOS);
+    # chosen here so importers keep their own event loop policy
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = asyncio.new_event_loop
+    
+    # Keep the loop open after main() so the atexit hook can disconnect on it
+    loop = loop_factory()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(main())
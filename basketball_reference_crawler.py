@@ -1,27 +1,67 @@
+import asyncio
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+import io
 import time
 import json
-from urllib.parse import urljoin, urlparse, parse_qs
+from urllib.parse import urljoin, urlparse, urlsplit
 import urllib.robotparser
 from urllib.robotparser import RobotFileParser
 import sqlite3
 from datetime import datetime, timedelta
-from typing import Set, List, Dict, Optional, Tuple, Callable
+from typing import Set, List, Dict, Optional, Tuple, Callable, Iterable, Iterator
 import logging
-from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+from dataclasses import dataclass, field
 import re
 from pathlib import Path
 import concurrent.futures
-from threading import Lock
+from threading import Lock, Thread
 import hashlib
+import functools
 import sys
 import queue
+import heapq
+import itertools
+from collections import Counter, OrderedDict
+
+# Optional: faster robots.txt matcher
+try:
+    from protego import Protego
+    HAS_PROTEGO = True
+except ImportError:
+    HAS_PROTEGO = False
+
+# Optional: BLAKE3 for page content hashes (falls back to stdlib BLAKE2b)
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+# Optional: Bloom filter for memory-bounded URL membership checks
+try:
+    from pybloom_live import ScalableBloomFilter
+    HAS_BLOOM = True
+except ImportError:
+    HAS_BLOOM = False
+
+# Optional: RE2 for linear-time URL matching (falls back to re)
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
 
 # Import your existing NBA data functions
 from rag_manager import (
     extract_nba_team_stats, 
     add_nba_data_to_knowledge_base,
+    build_nba_chunks,
+    add_chunks_to_knowledge_base,
+    generate_nba_narrative,
     init_chromadb
 )
 
@@ -36,7 +76,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+def compile_url_pattern(pattern: str):
+    """Compile a URL-matching regex with RE2 when available, else with re"""
+    if HAS_RE2:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass  # Syntax RE2 does not support (e.g. backreferences)
+    return re.compile(pattern)
+
+# First path segment -> archive category; league pages are split further by suffix
+_LEAGUE_PAGE_RE = compile_url_pattern(r'_(per_game|totals|advanced)')
+_SECTION_CATEGORIES = {
+    'teams': 'Team Pages',
+    'players': 'Player Pages',
+    'playoffs': 'Playoff Data',
+    'awards': 'Awards & Honors',
+}
+_LEAGUE_CATEGORIES = {
+    'per_game': 'Player Statistics',
+    'totals': 'Player Totals',
+    'advanced': 'Advanced Stats',
+}
+
+# Direct child cells of a <tr>, in document order
+_ROW_CELLS_XPATH = etree.XPath('td | th')
+
+# Query parameters whose name starts with a tracking prefix (utm_, ref_, fb, tw)
+_TRACKING_PARAM_RE = re.compile(r'(?:^|&)(?:utm_|ref_|fb|tw)[^&]*')
+
+@dataclass(slots=True)
 class CrawlConfig:
     """Configuration for the Basketball-Reference crawler"""
     base_domain: str = "www.basketball-reference.com"
@@ -47,12 +116,18 @@ class CrawlConfig:
     user_agent: str = "Basketball-Reference Archiver Bot 1.0"
     timeout: int = 15
     max_retries: int = 3
+    max_page_bytes: int = 8 * 1024 * 1024  # Larger responses are truncated
     retry_delay_base: float = 15.0  # Base delay for exponential backoff on retries
     rate_limit_delay: float = 600.0  # 10 minute delay when rate limited (was 60s)
+    recrawl: bool = False  # Revisit pages finished by earlier crawls with conditional GETs
+    
+    # URL patterns to prioritize or skip (stored as tuples)
+    priority_patterns: Tuple[str, ...] = None
+    skip_patterns: Tuple[str, ...] = None
     
-    # URL patterns to prioritize or skip
-    priority_patterns: List[str] = None
-    skip_patterns: List[str] = None
+    # Compiled from the patterns in __post_init__
+    _priority_res: Tuple[re.Pattern, ...] = field(default=None, repr=False, init=False)
+    _skip_re: Optional[re.Pattern] = field(default=None, repr=False, init=False)  # RE2 when available
     
     def __post_init__(self):
         if self.priority_patterns is None:
@@ -81,6 +156,297 @@ class CrawlConfig:
                 r'#',  # Fragment URLs
                 r'\?utm_', r'\?ref_',  # Tracking parameters
             ]
+        
+        self.priority_patterns = tuple(self.priority_patterns)
+        self.skip_patterns = tuple(self.skip_patterns)
+        
+        # Compile patterns once; skip patterns are folded into one alternation
+        self._priority_res = tuple(re.compile(p) for p in self.priority_patterns)
+        self._skip_re = compile_url_pattern("|".join(f"(?:{p})" for p in self.skip_patterns)) if self.skip_patterns else None
+
+def _content_hasher():
+    return blake3.blake3() if HAS_BLAKE3 else hashlib.blake2b(digest_size=16)
+
+def _hexdigest(hasher) -> str:
+    return hasher.hexdigest(length=16) if HAS_BLAKE3 else hasher.hexdigest()
+
+def page_content_hash(content: bytes) -> str:
+    """128-bit hex digest of raw page bytes, used for change detection only"""
+    hasher = _content_hasher()
+    hasher.update(content)
+    return _hexdigest(hasher)
+
+def data_content_hash(data: Dict) -> str:
+    """
+    128-bit hex digest of extracted page data, hashed field by field so the
+    whole dict is never stringified at once. The extraction timestamp is left
+    out so unchanged data hashes the same on every crawl.
+    """
+    hasher = _content_hasher()
+    for key in sorted(data):
+        if key == 'extraction_timestamp':
+            continue
+        hasher.update(key.encode())
+        hasher.update(repr(data[key]).encode())
+    return _hexdigest(hasher)
+
+# Text equivalents for emoji in console logs, applied in one regex pass
+_CONSOLE_EMOJI = {
+    '🚀': '[START]',
+    '✅': '[SUCCESS]',
+    '❌': '[ERROR]',
+    '⚠️': '[WARNING]',
+    '🔍': '[FETCH]',
+    '🤖': '[ROBOT]',
+    '📊': '[DATA]',
+    '🔄': '[PROCESS]',
+    '⏱️': '[WAIT]',
+    '🌱': '[SEED]',
+    '🎉': '[COMPLETE]',
+    '⏭️': '[SKIP]',
+    '🔌': '[CONNECTION]',
+    '⏰': '[TIMEOUT]'
+}
+_CONSOLE_EMOJI_RE = re.compile('|'.join(map(re.escape, sorted(_CONSOLE_EMOJI, key=len, reverse=True))))
+
+class _SafeFormatter(logging.Formatter):
+    """Formatter that swaps emoji for text tags so consoles without Unicode cope"""
+    def format(self, record):
+        msg = super().format(record)
+        if msg.isascii():
+            return msg
+        return _CONSOLE_EMOJI_RE.sub(lambda m: _CONSOLE_EMOJI[m.group(0)], msg)
+
+# One listener per process, shared by every crawler instance: workers only
+# enqueue records and the listener thread does the console and file writes,
+# so logging never blocks the event loop
+_log_listener: Optional[QueueListener] = None
+_log_queue_handler: Optional[QueueHandler] = None
+_log_listener_lock = Lock()
+
+def _start_log_listener():
+    """Start the shared log listener and point the root logger at it (once)"""
+    global _log_listener, _log_queue_handler
+    with _log_listener_lock:
+        if _log_listener is not None:
+            return
+        
+        # Setup console handler with safe formatting
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(_SafeFormatter('%(asctime)s - %(levelname)s - %(message)s'))
+        
+        # Setup file handler with UTF-8 encoding
+        try:
+            file_handler = logging.FileHandler('crawler.log', encoding='utf-8')
+            file_handler.setLevel(logging.INFO)
+            file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            handlers = [console_handler, file_handler]
+        except Exception as e:
+            # Fallback to console only if file handler fails
+            print(f"Warning: Could not create log file: {e}")
+            handlers = [console_handler]
+        
+        log_queue = queue.SimpleQueue()
+        _log_queue_handler = QueueHandler(log_queue)
+        _log_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # real formatting happens in the listener
+        _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _log_listener.start()
+        
+        # Configure logger
+        logging.basicConfig(
+            level=logging.INFO,
+            handlers=[_log_queue_handler],
+            force=True  # Override any existing configuration
+        )
+
+def _stop_log_listener():
+    """Write out queued log records and log directly from here on"""
+    global _log_listener
+    with _log_listener_lock:
+        listener, _log_listener = _log_listener, None
+        if listener is None:
+            return
+        listener.stop()
+        root = logging.getLogger()
+        if _log_queue_handler in root.handlers:
+            root.removeHandler(_log_queue_handler)
+            for handler in listener.handlers:
+                root.addHandler(handler)
+
+atexit.register(_stop_log_listener)
+
+MIN_TABLE_ROWS = 2  # single-row tables are layout, not stats
+
+def _element_text(element: etree._Element) -> str:
+    return ''.join(element.itertext()).strip()
+
+def extract_table_data(table: etree._Element) -> Optional[Dict]:
+    """Extract structured data from an lxml <table> (same shape as rag_manager.extract_table_data)"""
+    caption = table.find('caption')
+    table_title = _element_text(caption) if caption is not None else "NBA Data Table"
+    
+    # Extract headers from thead, falling back to the first row
+    thead = table.find('thead')
+    header_row = thead if thead is not None else table.find('.//tr')
+    headers = []
+    if header_row is not None:
+        headers = [text for text in map(_element_text, header_row.iter('th', 'td')) if text]
+    
+    # Extract rows (skip the header row when there is no thead)
+    rows = []
+    tbody = table.find('tbody')
+    row_elements = (tbody if tbody is not None else table).iter('tr')
+    if thead is None:
+        next(row_elements, None)
+    for row in row_elements:
+        row_data = []
+        for cell in _ROW_CELLS_XPATH(row):
+            cell_text = _element_text(cell)
+            # Handle links (player names, team names)
+            link = cell.find('.//a')
+            if link is not None:
+                cell_text = f"{cell_text} [{link.get('href', '')}]"
+            row_data.append(cell_text)
+        
+        if any(cell.strip() for cell in row_data):  # Skip empty rows
+            rows.append(row_data)
+    
+    if len(rows) < MIN_TABLE_ROWS:
+        return None
+    
+    return {
+        'title': table_title,
+        'headers': headers,
+        'rows': rows,
+        'row_count': len(rows),
+        'column_count': len(headers) if headers else len(rows[0])
+    }
+
+@dataclass(slots=True)
+class ParsedPage:
+    """The parts of a fetched page the crawler uses"""
+    title: str
+    tables: List[Dict]
+    hrefs: List[str]
+
+@dataclass(slots=True)
+class FetchResult:
+    """A fetched page; page is None when it is unchanged since the last crawl"""
+    page: Optional[ParsedPage]
+    body: bytes
+    content_hash: Optional[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    
+    @property
+    def unchanged(self) -> bool:
+        return self.page is None
+
+def parse_page(content: bytes) -> ParsedPage:
+    """
+    Stream-parse a page with iterparse, extracting each table as soon as it
+    closes. Finished top-level tables and everything before them are freed
+    right away, so the full DOM is never held at once.
+    """
+    title = None
+    tables = []
+    hrefs = []
+    for _, element in etree.iterparse(io.BytesIO(content), tag=('title', 'a', 'table'), html=True, recover=True):
+        tag = element.tag
+        if tag == 'a':
+            href = element.get('href')
+            if href:
+                hrefs.append(href)
+        elif tag == 'table':
+            data = extract_table_data(element)
+            if data:
+                tables.append(data)
+            # Nested tables are freed with their outer table
+            if next(element.iterancestors('table'), None) is None:
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        elif title is None:
+            title = _element_text(element)
+    return ParsedPage(title=title or 'NBA Data', tables=tables, hrefs=hrefs)
+
+class SqliteUrlSet:
+    """
+    Set view over rows of the crawler's urls table, optionally limited to some
+    statuses. Membership is answered by an indexed lookup on the urls primary
+    key, fronted by a Bloom filter (when pybloom_live is installed) and a small
+    LRU cache of known members, so memory stays bounded however many URLs the
+    crawl has seen. Rows are written by the crawler's save_url_status; add()
+    only records membership for this process until that write lands.
+    
+    Lookups run synchronously on the event loop. A miss in the filter and cache
+    costs one primary key probe on a read-only WAL connection, which does not
+    wait for the writer thread's batches, so it stays in the microseconds.
+    """
+    
+    CACHE_SIZE = 50_000
+    SEED_BATCH = 10_000
+    
+    def __init__(self, crawler: 'BasketballReferenceCrawler', statuses: Tuple[str, ...] = ()):
+        self._crawler = crawler
+        self._params = tuple(statuses)
+        status_filter = f"status IN ({', '.join('?' for _ in statuses)})" if statuses else "1"
+        self._lookup_sql = f"SELECT 1 FROM urls WHERE url = ? AND {status_filter}"
+        self._cache: 'OrderedDict[str, None]' = OrderedDict()
+        self._lock = Lock()
+        self._count = crawler._exec(f"SELECT COUNT(*) FROM urls WHERE {status_filter}", self._params)[0][0]
+        self._bloom = None
+        if HAS_BLOOM:
+            # The Bloom filter must cover every stored row to answer "no" on
+            # its own; stream them in without keeping the strings around
+            self._bloom = ScalableBloomFilter(initial_capacity=max(100_000, 2 * self._count), error_rate=1e-4)
+            with crawler._db_lock:
+                cursor = crawler._db.execute(f"SELECT url FROM urls WHERE {status_filter}", self._params)
+                while True:
+                    rows = cursor.fetchmany(self.SEED_BATCH)
+                    if not rows:
+                        break
+                    for (url,) in rows:
+                        self._bloom.add(url)
+    
+    def __contains__(self, url: str) -> bool:
+        if self._bloom is not None and url not in self._bloom:
+            return False
+        with self._lock:
+            if url in self._cache:
+                self._cache.move_to_end(url)
+                return True
+        if not self._crawler._lookup(self._lookup_sql, (url, *self._params)):
+            return False
+        self._remember(url)
+        return True
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def add(self, url: str):
+        if url in self:
+            return
+        self._remember(url)
+        if self._bloom is not None:
+            self._bloom.add(url)
+        self._count += 1
+    
+    def update(self, urls):
+        for url in urls:
+            self.add(url)
+    
+    def difference(self, urls) -> List[str]:
+        """URLs from the iterable that are not in this set, in order"""
+        return [url for url in urls if url not in self]
+    
+    def _remember(self, url: str):
+        with self._lock:
+            self._cache[url] = None
+            self._cache.move_to_end(url)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
 
 class BasketballReferenceCrawler:
     """
@@ -95,86 +461,71 @@ class BasketballReferenceCrawler:
         # Initialize databases and state
         self.db_path = "basketball_crawler.db"
         self.crawl_id = None
-        self.url_queue = queue.Queue()
-        self.processed_urls = set()
+        # URL frontier: heap of (-priority, insertion order, url) plus a set of
+        # queued URLs for O(1) membership checks. Only touched from the crawl's
+        # event loop (or before it starts), so it needs no lock. All workers
+        # share it on purpose: per-worker queues would only remove contention
+        # that coroutines do not have, and would break global priority order.
+        self._heap: List[Tuple[int, int, str]] = []
+        self._queued: Set[str] = set()
+        self._heap_counter = itertools.count()
         self.failed_urls = set()
-        self.discovered_urls = set()
         self.stop_crawling = False
         self.robots_parser = None
-        self.session_stats = {
+        self._robots_allowed = functools.lru_cache(maxsize=4096)(self._check_robots)
+        self._url_priority = functools.lru_cache(maxsize=200_000)(self._compute_url_priority)
+        # Counters are bumped in per-page batches through _record_stats
+        self.session_stats = Counter({
             'pages_crawled': 0,
             'pages_archived': 0,
             'chunks_added': 0,
             'errors': 0,
             'discovered_urls': 0,
             'queue_size': 0
-        }
+        })
+        self._stats_lock = Lock()
+        
+        # Event loop state, set while start_crawl is running the workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._frontier_ready: Optional[asyncio.Event] = None
+        self._progress_ready: Optional[asyncio.Event] = None
+        self._in_flight = 0  # pages workers are processing; only these can add URLs
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._page_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
         
         # Setup logging
         self.setup_logging()
         
         # Initialize components
         self.init_databases()
+        # Failed URLs are retried on the next run, so only finished pages count
+        # as processed; any stored row counts as discovered. A recrawl revisits
+        # finished pages too, so it only skips pages fetched during this run.
+        if self.config.recrawl:
+            self.processed_urls = set()
+        else:
+            self.processed_urls = SqliteUrlSet(self, ('processed', 'completed', 'unchanged'))
+        self.discovered_urls = SqliteUrlSet(self)
         
-        # Check robots.txt with better error handling
-        try:
-            self.check_robots_txt()
-            self.log_message("✅ Robots.txt loaded successfully", "success")
-        except Exception as e:
-            self.log_message(f"⚠️ Robots.txt warning: {str(e)}", "warning")
-    
-    def setup_logging(self):
-        """Setup logging configuration with proper Unicode handling"""
-        # Create a custom formatter that handles Unicode properly
-        class SafeFormatter(logging.Formatter):
-            def format(self, record):
-                # Remove emoji from console logs but keep the message
-                msg = super().format(record)
-                # Replace common emoji with text equivalents for console
-                emoji_replacements = {
-                    '🚀': '[START]',
-                    '✅': '[SUCCESS]',
-                    '❌': '[ERROR]',
-                    '⚠️': '[WARNING]',
-                    '🔍': '[FETCH]',
-                    '🤖': '[ROBOT]',
-                    '📊': '[DATA]',
-                    '🔄': '[PROCESS]',
-                    '⏱️': '[WAIT]',
-                    '🌱': '[SEED]',
-                    '🎉': '[COMPLETE]',
-                    '⏭️': '[SKIP]',
-                    '🔌': '[CONNECTION]',
-                    '⏰': '[TIMEOUT]'
-                }
-                for emoji, replacement in emoji_replacements.items():
-                    msg = msg.replace(emoji, replacement)
-                return msg
+        # Knowledge base writes are buffered and embedded in batches
+        self._kb_buffer: List[Tuple[List[str], List[Dict]]] = []
+        self._kb_flush_size = 32
+        self._kb_lock = Lock()
         
-        # Setup console handler with safe formatting
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_formatter = SafeFormatter('%(asctime)s - %(levelname)s - %(message)s')
-        console_handler.setFormatter(console_formatter)
-        
-        # Setup file handler with UTF-8 encoding
-        try:
-            file_handler = logging.FileHandler('crawler.log', encoding='utf-8')
-            file_handler.setLevel(logging.INFO)
-            file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            file_handler.setFormatter(file_formatter)
-            handlers = [console_handler, file_handler]
-        except Exception as e:
-            # Fallback to console only if file handler fails
-            print(f"Warning: Could not create log file: {e}")
-            handlers = [console_handler]
+        # URL status and archive rows are written in batches by a background thread
+        self._write_queue = queue.Queue()
+        self._writer_thread = Thread(target=self._db_writer_loop, name="crawler-db-writer", daemon=True)
+        self._writer_thread.start()
+        # The writer is a daemon thread; make sure queued rows reach the
+        # database if the instance is never closed explicitly
+        atexit.register(self.close)
         
-        # Configure logger
-        logging.basicConfig(
-            level=logging.INFO,
-            handlers=handlers,
-            force=True  # Override any existing configuration
-        )
+        # Check robots.txt (failures are logged and treated as no restrictions)
+        self.check_robots_txt()
+    
+    def setup_logging(self):
+        """Route this crawler's logging through the shared queue listener"""
+        _start_log_listener()
         self.logger = logging.getLogger(__name__)
         
         # Test log message
@@ -202,15 +553,21 @@ class BasketballReferenceCrawler:
             except Exception as e:
                 self.logger.error(f"Error in log callback: {e}")
     
+    def _record_stats(self, counts: Dict[str, int]):
+        """Add a batch of counter increments to session_stats in one step"""
+        with self._stats_lock:
+            self.session_stats.update(counts)
+    
     def update_progress(self, **kwargs):
         """Update progress statistics and notify callback"""
         # Update session stats
-        for key, value in kwargs.items():
-            if key in self.session_stats:
-                self.session_stats[key] = value
-        
-        # Update queue size
-        self.session_stats['queue_size'] = self.url_queue.qsize()
+        with self._stats_lock:
+            for key, value in kwargs.items():
+                if key in self.session_stats:
+                    self.session_stats[key] = value
+            
+            # Update queue size
+            self.session_stats['queue_size'] = self.queue_size()
         
         # Send to callback for real-time UI updates
         if self.progress_callback:
@@ -223,14 +580,20 @@ class BasketballReferenceCrawler:
         """Initialize SQLite databases for tracking crawl progress"""
         self.db_path = Path("basketball_crawler.db")
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        # One long-lived connection shared by all threads (autocommit mode;
+        # multi-statement writes use explicit BEGIN/COMMIT)
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._db_lock = Lock()
+        self._init_db_pragmas()
+        
+        with self._db_lock:
+            cursor = self._db.cursor()
             
             # URLs table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS urls (
                     url TEXT PRIMARY KEY,
-                    status TEXT NOT NULL,  -- discovered, processing, completed, failed
+                    status TEXT NOT NULL,  -- discovered, processing, completed, unchanged, failed
                     priority INTEGER DEFAULT 0,
                     discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     processed_at TIMESTAMP,
@@ -238,10 +601,18 @@ class BasketballReferenceCrawler:
                     error_message TEXT,
                     page_title TEXT,
                     data_chunks INTEGER DEFAULT 0,
-                    content_hash TEXT
+                    content_hash TEXT,
+                    etag TEXT,
+                    last_modified TEXT
                 )
             """)
             
+            # HTTP validator columns were added later; upgrade older databases
+            url_columns = {row[1] for row in cursor.execute("PRAGMA table_info(urls)")}
+            for column in ('etag', 'last_modified'):
+                if column not in url_columns:
+                    cursor.execute(f"ALTER TABLE urls ADD COLUMN {column} TEXT")
+            
             # Crawl sessions table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS crawl_sessions (
@@ -270,7 +641,37 @@ class BasketballReferenceCrawler:
                 )
             """)
             
-            conn.commit()
+            # URL sets are answered from the urls table directly now
+            cursor.execute("DROP TABLE IF EXISTS seen_urls")
+            
+            # Crawl state is looked up by status and ordered by priority
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_urls_status ON urls(status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_urls_priority ON urls(priority DESC)")
+        
+        # Separate read-only connection for URL set lookups made on the event
+        # loop; under WAL it never waits for the writer thread's transactions
+        self._lookup_db = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+        self._lookup_lock = Lock()
+    
+    def _init_db_pragmas(self):
+        """Tune the shared connection for bulk writes with concurrent reads"""
+        with self._db_lock:
+            conn = self._db
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-65536")  # 64 MB
+            conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+            conn.execute("PRAGMA temp_store=MEMORY")
+    
+    def _exec(self, sql: str, params=()) -> List[tuple]:
+        """Run a statement on the shared connection and return all rows"""
+        with self._db_lock:
+            return self._db.execute(sql, params).fetchall()
+    
+    def _lookup(self, sql: str, params=()) -> List[tuple]:
+        """Run a point query on the read-only lookup connection"""
+        with self._lookup_lock:
+            return self._lookup_db.execute(sql, params).fetchall()
     
     def check_robots_txt(self):
         """Check and parse robots.txt with better error handling"""
@@ -278,13 +679,17 @@ class BasketballReferenceCrawler:
             robots_url = f"https://{self.config.base_domain}/robots.txt"
             self.log_message(f"🤖 Fetching robots.txt from {robots_url}", "info")
             
-            headers = {'User-Agent': self.config.user_agent}
-            response = requests.get(robots_url, headers=headers, timeout=10)
+            # One-off blocking fetch; this runs before the event loop exists
+            response = requests.get(robots_url, headers={'User-Agent': self.config.user_agent}, timeout=10)
             
+            self._robots_allowed.cache_clear()
             if response.status_code == 200:
-                self.robots_parser = RobotFileParser()
-                self.robots_parser.set_url(robots_url)
-                self.robots_parser.read()
+                if HAS_PROTEGO:
+                    self.robots_parser = Protego.parse(response.text)
+                else:
+                    self.robots_parser = RobotFileParser()
+                    self.robots_parser.set_url(robots_url)
+                    self.robots_parser.parse(response.text.splitlines())
                 self.log_message("✅ Robots.txt parsed successfully", "success")
             else:
                 self.log_message(f"⚠️ Robots.txt returned status {response.status_code}, proceeding without restrictions", "warning")
@@ -299,76 +704,136 @@ class BasketballReferenceCrawler:
         if not self.robots_parser:
             return True
         
+        # Rules only look at the path and query, so cache on that
+        parsed = urlparse(url)
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+        return self._robots_allowed(path)
+    
+    def _check_robots(self, path: str) -> bool:
+        """Uncached robots.txt check for a site-relative path"""
+        url = f"https://{self.config.base_domain}{path}"
         try:
+            if HAS_PROTEGO and isinstance(self.robots_parser, Protego):
+                return self.robots_parser.can_fetch(url, self.config.user_agent)
             return self.robots_parser.can_fetch(self.config.user_agent, url)
         except:
             return True  # Default to allowing if check fails
     
     def load_crawl_state(self):
-        """Load previous crawl state from database"""
+        """
+        Re-queue URLs a previous crawl discovered but did not finish. A recrawl
+        re-queues finished pages as well; fetch_page sends their stored ETag and
+        Last-Modified so unchanged pages come back as 304 Not Modified.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Load discovered URLs
-                cursor.execute("SELECT url, priority FROM urls WHERE status IN ('discovered', 'failed')")
-                for url, priority in cursor.fetchall():
-                    self.discovered_urls.add(url)
-                    self.priority_queue.append((priority or 0, url))
-                
-                # Load processed URLs
-                cursor.execute("SELECT url FROM urls WHERE status = 'completed'")
-                self.processed_urls = {row[0] for row in cursor.fetchall()}
-                
-                # Sort priority queue
-                self.priority_queue.sort(reverse=True)
-                
-                logger.info(f"Loaded crawl state: {len(self.discovered_urls)} discovered, {len(self.processed_urls)} processed")
+            # processed_urls / discovered_urls read the urls table directly, so
+            # only the in-memory frontier needs rebuilding
+            if self.config.recrawl:
+                sql = "SELECT url, priority FROM urls"
+            else:
+                sql = "SELECT url, priority FROM urls WHERE status IN ('discovered', 'failed')"
+            requeued = 0
+            for url, priority in self._exec(sql):
+                if self._push_url(url, priority or 0):
+                    requeued += 1
+            if requeued:
+                self._signal_frontier()
+            
+            logger.info(f"Loaded crawl state: {requeued} re-queued, {len(self.processed_urls)} processed")
         
         except Exception as e:
             logger.error(f"Error loading crawl state: {e}")
     
+    # Columns save_url_status accepts as keyword arguments
+    URL_STATUS_FIELDS = ('priority', 'retry_count', 'error_message', 'page_title', 'data_chunks', 'content_hash', 'etag', 'last_modified')
+    WRITE_BATCH_SIZE = 500
+    WRITE_BATCH_WAIT = 0.25  # seconds
+    
     def save_url_status(self, url: str, status: str, **kwargs):
-        """Save URL status to database"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Build update query dynamically
-                fields = ['status']
-                values = [status]
-                
-                for key, value in kwargs.items():
-                    if key in ['priority', 'retry_count', 'error_message', 'page_title', 'data_chunks', 'content_hash']:
-                        fields.append(key)
-                        values.append(value)
-                
-                if status in ['completed', 'failed']:
-                    fields.append('processed_at')
-                    values.append(datetime.now().isoformat())
-                
-                placeholders = ', '.join([f"{field} = ?" for field in fields])
-                values.append(url)
-                
-                cursor.execute(f"""
-                    INSERT OR REPLACE INTO urls (url, {', '.join(fields)}, discovered_at)
-                    VALUES (?, {', '.join(['?' for _ in fields])}, 
-                           COALESCE((SELECT discovered_at FROM urls WHERE url = ?), CURRENT_TIMESTAMP))
-                """, values + [url])
-                
-                conn.commit()
-        
-        except Exception as e:
-            logger.error(f"Error saving URL status: {e}")
+        """Queue a URL status update for the background writer"""
+        processed_at = datetime.now().isoformat() if status in ['completed', 'unchanged', 'failed'] else None
+        row = (url, status, *(kwargs.get(field) for field in self.URL_STATUS_FIELDS), processed_at)
+        self._write_queue.put(('urls', row))
+    
+    def flush_url_status(self):
+        """Block until every queued URL status and archive row has been written"""
+        self._write_queue.join()
+    
+    def _db_writer_loop(self):
+        """Drain queued rows and write each batch in one transaction"""
+        # Unset columns keep their stored value; discovered_at is never overwritten
+        # and re-discovering a URL never resets its status
+        upsert_sql = f"""
+            INSERT INTO urls (url, status, {', '.join(self.URL_STATUS_FIELDS)}, processed_at)
+            VALUES (?, ?, {', '.join('?' for _ in self.URL_STATUS_FIELDS)}, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                status = CASE WHEN excluded.status = 'discovered' THEN urls.status ELSE excluded.status END,
+                {', '.join(f"{field} = COALESCE(excluded.{field}, urls.{field})" for field in self.URL_STATUS_FIELDS)},
+                processed_at = COALESCE(excluded.processed_at, urls.processed_at)
+        """
+        statements = {
+            'urls': upsert_sql,
+            'archived_pages': """
+                INSERT OR REPLACE INTO archived_pages
+                (url, title, content_hash, table_count, chunk_count, category, archived_at)
+                VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+            """,
+        }
+        while True:
+            batch = [self._write_queue.get()]
+            deadline = time.monotonic() + self.WRITE_BATCH_WAIT
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            # close() queues None to stop the writer once everything before it is written
+            closing = None in batch
+            rows_by_table: Dict[str, List[tuple]] = {}
+            for item in batch:
+                if item is not None:
+                    table, row = item
+                    rows_by_table.setdefault(table, []).append(row)
+            
+            try:
+                with self._db_lock:
+                    try:
+                        self._db.execute("BEGIN IMMEDIATE")
+                        for table, rows in rows_by_table.items():
+                            self._db.executemany(statements[table], rows)
+                        self._db.execute("COMMIT")
+                    except Exception:
+                        if self._db.in_transaction:
+                            self._db.execute("ROLLBACK")
+                        raise
+            except Exception as e:
+                logger.error(f"Error saving crawl state batch ({len(batch)} rows): {e}")
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+            
+            if closing:
+                return
     
     def get_url_priority(self, url: str) -> int:
-        """Calculate URL priority based on patterns"""
+        """Calculate URL priority based on patterns (memoised per URL)"""
+        return self._url_priority(url)
+    
+    def _compute_url_priority(self, url: str) -> int:
+        """Uncached URL priority calculation"""
         priority = 0
         
         # Check priority patterns
-        for i, pattern in enumerate(self.config.priority_patterns):
-            if re.search(pattern, url):
-                priority += (len(self.config.priority_patterns) - i) * 10
+        priority_res = self.config._priority_res
+        for i, pattern in enumerate(priority_res):
+            if pattern.search(url):
+                priority += (len(priority_res) - i) * 10
         
         # Boost recent seasons
         current_year = datetime.now().year
@@ -384,110 +849,157 @@ class BasketballReferenceCrawler:
     
     def should_skip_url(self, url: str) -> bool:
         """Check if URL should be skipped based on patterns"""
-        for pattern in self.config.skip_patterns:
-            if re.search(pattern, url):
-                return True
-        return False
+        skip_re = self.config._skip_re
+        return bool(skip_re and skip_re.search(url))
+    
+    def clean_link(self, page_url: str, href: str) -> Optional[str]:
+        """Resolve a link against its page; None unless it stays on the crawled site"""
+        if not href:
+            return None
+        
+        # Convert relative URLs to absolute
+        parsed = urlparse(urljoin(page_url, href))
+        
+        # Only process basketball-reference.com URLs
+        if parsed.netloc != self.config.base_domain:
+            return None
+        
+        # Clean URL (remove fragments and tracking parameters)
+        clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        if parsed.query:
+            # Keep important query parameters, remove tracking
+            query = _TRACKING_PARAM_RE.sub('', parsed.query).lstrip('&')
+            if query:
+                clean_url += '?' + query
+        return clean_url
     
-    def discover_urls_from_page(self, url: str, soup: BeautifulSoup) -> List[str]:
+    def discover_urls_from_page(self, url: str, page: ParsedPage) -> List[str]:
         """Extract relevant URLs from a page"""
-        discovered = []
+        # Clean, filter and de-duplicate all links in one pass (document order kept)
+        skip_re = self.config._skip_re
+        candidates = dict.fromkeys(
+            clean_url
+            for clean_url in (self.clean_link(url, href) for href in page.hrefs)
+            if clean_url and not (skip_re and skip_re.search(clean_url))
+        )
         
-        # Find all links
-        for link in soup.find_all('a', href=True):
-            href = link.get('href')
-            if not href:
-                continue
-            
-            # Convert relative URLs to absolute
-            full_url = urljoin(url, href)
-            parsed = urlparse(full_url)
-            
-            # Only process basketball-reference.com URLs
-            if parsed.netloc != self.config.base_domain:
-                continue
-            
-            # Clean URL (remove fragments and tracking parameters)
-            clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-            if parsed.query:
-                # Keep important query parameters, remove tracking
-                query_params = parse_qs(parsed.query)
-                important_params = {k: v for k, v in query_params.items() 
-                                  if not k.startswith(('utm_', 'ref_', 'fb', 'tw'))}
-                if important_params:
-                    from urllib.parse import urlencode
-                    clean_url += '?' + urlencode(important_params, doseq=True)
-            
-            # Skip if should be skipped
-            if self.should_skip_url(clean_url):
-                continue
-            
-            # Skip if already processed
-            if clean_url in self.processed_urls:
-                continue
-            
-            # Add to discovered URLs
-            if clean_url not in self.discovered_urls:
-                discovered.append(clean_url)
-                self.discovered_urls.add(clean_url)
+        # Drop already seen URLs in bulk. Every processed URL was queued first,
+        # so discovered_urls covers processed_urls and one Bloom/SQLite pass is enough.
+        discovered = self.discovered_urls.difference(candidates)
+        self.discovered_urls.update(discovered)
         
         return discovered
     
-    def fetch_page(self, url: str) -> Optional[Tuple[BeautifulSoup, str]]:
-        """Fetch a single page with improved error handling and timeout management"""
+    def _get_http(self) -> aiohttp.ClientSession:
+        """Keep-alive HTTP session for the running crawl, created on first use"""
+        if self._http is None or self._http.closed:
+            # Every request goes to one host: keep one pooled connection per
+            # worker alive and cache the DNS lookup for the whole crawl
+            connector = aiohttp.TCPConnector(
+                limit=max(10, self.config.max_concurrent_threads),
+                limit_per_host=self.config.max_concurrent_threads,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            # aiohttp negotiates gzip/deflate (and br when Brotli is installed)
+            self._http = aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': self.config.user_agent},
+                timeout=aiohttp.ClientTimeout(total=10)  # Reduced from 15 to 10 seconds
+            )
+        return self._http
+    
+    async def _read_body(self, response: aiohttp.ClientResponse, url: str) -> bytes:
+        """Read a response body, stopping at config.max_page_bytes"""
+        cap = self.config.max_page_bytes
+        buf = bytearray()
+        async for chunk in response.content.iter_chunked(65536):
+            buf.extend(chunk)
+            if len(buf) > cap:
+                self.log_message(f"⚠️ Page larger than {cap} bytes, truncating: {url}", "warning")
+                del buf[cap:]
+                break
+        return bytes(buf)
+    
+    def _stored_validators(self, url: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """ETag, Last-Modified and content hash recorded for a URL by an earlier crawl"""
+        rows = self._exec("SELECT etag, last_modified, content_hash FROM urls WHERE url = ?", (url,))
+        return rows[0] if rows else (None, None, None)
+    
+    async def fetch_page(self, url: str) -> Optional[FetchResult]:
+        """
+        Fetch a single page with improved error handling and timeout management.
+        Pages seen before are requested conditionally, and are not parsed again
+        when the server answers 304 or the body hashes the same as last time.
+        """
+        # The lookup waits on the DB lock the writer thread holds during batches
+        etag, last_modified, stored_hash = await asyncio.to_thread(self._stored_validators, url)
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        
         for attempt in range(self.config.max_retries):
             try:
                 self.log_message(f"🔄 Fetching: {url} (attempt {attempt + 1})", "info")
                 
-                headers = {'User-Agent': self.config.user_agent}
-                
-                # Reduced timeout to prevent hanging
-                response = requests.get(
-                    url, 
-                    headers=headers, 
-                    timeout=10,  # Reduced from 15 to 10 seconds
-                    allow_redirects=True
-                )
-                
-                # Handle different status codes
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    return soup, response.text
+                async with self._get_http().get(url, headers=headers, allow_redirects=True) as response:
+                    # Handle different status codes
+                    if response.status == 200:
+                        body = await self._read_body(response, url)
+                        content_hash = page_content_hash(body)
+                        result = FetchResult(
+                            page=None,
+                            body=body,
+                            content_hash=content_hash,
+                            etag=response.headers.get('ETag'),
+                            last_modified=response.headers.get('Last-Modified')
+                        )
+                        if content_hash == stored_hash:
+                            self.log_message(f"⏭️ Content unchanged since last crawl: {url}", "info")
+                        else:
+                            result.page = await self._run_blocking(parse_page, body)
+                        return result
+                    
+                    elif response.status == 304:
+                        self.log_message(f"⏭️ Not modified since last crawl: {url}", "info")
+                        return FetchResult(page=None, body=b'', content_hash=stored_hash, etag=etag, last_modified=last_modified)
                 
-                elif response.status_code == 429:
-                    # Rate limited - use progressive backoff but with maximum limits
-                    base_delay = min(60.0, self.config.rate_limit_delay)  # Cap at 60 seconds max
-                    delay = base_delay * (2 ** attempt)  # Exponential backoff
-                    max_delay = 300.0  # Maximum 5 minutes instead of 20 minutes
-                    actual_delay = min(delay, max_delay)
+                    elif response.status == 429:
+                        # Rate limited - use progressive backoff but with maximum limits
+                        base_delay = min(60.0, self.config.rate_limit_delay)  # Cap at 60 seconds max
+                        delay = base_delay * (2 ** attempt)  # Exponential backoff
+                        max_delay = 300.0  # Maximum 5 minutes instead of 20 minutes
+                        actual_delay = min(delay, max_delay)
                     
-                    self.log_message(f"⚠️ Rate limited (429) for {url}. Waiting {actual_delay:.1f} seconds before retry {attempt + 1}", "warning")
+                        self.log_message(f"⚠️ Rate limited (429) for {url}. Waiting {actual_delay:.1f} seconds before retry {attempt + 1}", "warning")
                     
-                    # If this is the last attempt, don't wait
-                    if attempt < self.config.max_retries - 1:
-                        time.sleep(actual_delay)
-                    continue
+                        # If this is the last attempt, don't wait
+                        if attempt < self.config.max_retries - 1:
+                            await asyncio.sleep(actual_delay)
+                        continue
                 
-                else:
-                    self.log_message(f"❌ HTTP {response.status_code} for {url} - skipping", "error")
-                    return None
+                    else:
+                        self.log_message(f"❌ HTTP {response.status} for {url} - skipping", "error")
+                        return None
                     
-            except requests.exceptions.Timeout:
+            except asyncio.TimeoutError:
                 self.log_message(f"⏱️ Timeout fetching {url} (attempt {attempt + 1})", "warning")
                 if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay_base * (attempt + 1))
+                    await asyncio.sleep(self.config.retry_delay_base * (attempt + 1))
                 continue
                 
-            except requests.exceptions.ConnectionError as e:
+            except aiohttp.ClientConnectionError as e:
                 self.log_message(f"🔌 Connection error fetching {url} (attempt {attempt + 1}): {str(e)[:100]}", "warning")
                 if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay_base * (attempt + 1))
+                    await asyncio.sleep(self.config.retry_delay_base * (attempt + 1))
                 continue
                 
-            except requests.exceptions.RequestException as e:
+            except aiohttp.ClientError as e:
                 self.log_message(f"🚫 Request error fetching {url} (attempt {attempt + 1}): {str(e)[:100]}", "warning")
                 if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay_base)
+                    await asyncio.sleep(self.config.retry_delay_base)
                 continue
                 
             except Exception as e:
@@ -498,256 +1010,271 @@ class BasketballReferenceCrawler:
         self.log_message(f"❌ Failed to fetch {url} after {self.config.max_retries} attempts", "error")
         return None
     
-    def process_page(self, url: str) -> bool:
+    async def wait_for_next_request(self, fetch_started: float):
         """
-        Process a single page with enhanced progress tracking
+        Sleep out the rest of the request delay. The delay runs from the start
+        of the previous fetch, so parsing, archiving and DB work done since
+        then count towards it instead of being added on top.
         """
-        try:
-            self.log_message(f"🔄 Processing page: {url}", "info")
-            
-            # Update current URL in progress
-            self.update_progress(current_url=url)
-            
-            # Fetch the page
-            result = self.fetch_page(url)
-            if not result:
-                self.session_stats['errors'] += 1
-                self.update_progress(errors=self.session_stats['errors'])
-                return False
-            
-            soup, html_content = result
-            
-            # Update crawled count
-            self.session_stats['pages_crawled'] += 1
-            self.update_progress(pages_crawled=self.session_stats['pages_crawled'])
-            
-            # Extract data from the page
-            self.log_message(f"📊 Extracting data from: {url}", "info")
-            
-            # Here you would integrate with your NBA data extraction
-            # For now, simulate data extraction
-            extracted_data = self.extract_nba_data_from_page(soup, url)
-            
-            if extracted_data:
-                # Add to knowledge base (integrate with your RAG system)
-                chunks_added = self.add_to_knowledge_base(extracted_data, url)
-                
-                if chunks_added > 0:
-                    self.session_stats['pages_archived'] += 1
-                    self.session_stats['chunks_added'] += chunks_added
-                    self.log_message(f"✅ Archived {chunks_added} chunks from: {url}", "success")
-                    
-                    # Update progress
-                    self.update_progress(
-                        pages_archived=self.session_stats['pages_archived'],
-                        chunks_added=self.session_stats['chunks_added']
-                    )
-                else:
-                    self.log_message(f"⚠️ No data extracted from: {url}", "warning")
-            
-            # Discover new URLs
-            new_urls = self.discover_urls_from_page(url, soup)
-            if new_urls:
-                self.log_message(f"🔍 Discovered {len(new_urls)} new URLs", "info")
-                self.add_urls_to_queue(new_urls)
-            
-            # Save progress to database
-            self.save_url_status(url, "processed", chunks_added=chunks_added)
-            
-            # Delay before next request
-            self.log_message(f"⏱️ Waiting {self.config.delay_between_requests}s before next request", "info")
-            time.sleep(self.config.delay_between_requests)
-            
-            return True
-            
-        except Exception as e:
-            self.log_message(f"❌ Error processing {url}: {str(e)}", "error")
-            self.session_stats['errors'] += 1
-            self.update_progress(errors=self.session_stats['errors'])
-            return False
+        remaining = self.config.delay_between_requests - (time.monotonic() - fetch_started)
+        if remaining > 0:
+            self.log_message(f"⏱️ Waiting {remaining:.1f}s before next request", "info")
+            await asyncio.sleep(remaining)
     
-    def extract_nba_data_from_page(self, soup: BeautifulSoup, url: str) -> Optional[Dict]:
-        """Extract NBA data from a page (placeholder - integrate with your existing extraction)"""
+    def extract_nba_data_from_page(self, page: ParsedPage, url: str) -> Optional[Dict]:
+        """Build the knowledge base record (tables plus narrative) for a parsed page"""
         try:
-            # This would integrate with your existing NBA data extraction functions
-            # For now, return mock data
-            tables = soup.find_all('table')
-            if tables:
-                return {
-                    'url': url,
-                    'title': soup.find('title').get_text() if soup.find('title') else 'NBA Data',
-                    'table_count': len(tables),
-                    'extraction_timestamp': datetime.now().isoformat()
-                }
-            return None
+            tables = page.tables
+            if not tables:
+                return None
+            
+            extracted_data = {
+                'url': url,
+                'title': page.title,
+                'tables': tables,
+                'table_count': len(tables),
+                'extraction_timestamp': datetime.now().isoformat()
+            }
+            extracted_data['narrative_text'] = generate_nba_narrative(extracted_data)
+            return extracted_data
         except Exception as e:
             self.log_message(f"❌ Error extracting data: {str(e)}", "error")
             return None
     
     def add_to_knowledge_base(self, data: Dict, url: str) -> int:
-        """Add extracted data to knowledge base (placeholder - integrate with your RAG system)"""
+        """
+        Chunk a page's data and buffer it for the knowledge base. Embedding
+        happens in flush_knowledge_base, once per kb_flush_size pages.
+        """
         try:
-            # This would integrate with your existing RAG system
-            # For now, simulate adding chunks
-            import random
-            chunks_added = random.randint(2, 8)
-            return chunks_added
+            chunks, metadatas = build_nba_chunks(data)
+            with self._kb_lock:
+                self._kb_buffer.append((chunks, metadatas))
+                should_flush = len(self._kb_buffer) >= self._kb_flush_size
+            if should_flush:
+                self.flush_knowledge_base()
+            return len(chunks)
         except Exception as e:
             self.log_message(f"❌ Error adding to knowledge base: {str(e)}", "error")
             return 0
     
+    def flush_knowledge_base(self):
+        """Embed and store all buffered pages in one vector store call"""
+        with self._kb_lock:
+            buffered, self._kb_buffer = self._kb_buffer, []
+        if not buffered:
+            return
+        
+        chunks = [chunk for page_chunks, _ in buffered for chunk in page_chunks]
+        metadatas = [meta for _, page_metas in buffered for meta in page_metas]
+        try:
+            add_chunks_to_knowledge_base(chunks, metadatas)
+            self.log_message(f"📚 Stored {len(chunks)} chunks from {len(buffered)} pages in knowledge base", "success")
+        except Exception as e:
+            self.log_message(f"❌ Error writing {len(buffered)} pages to knowledge base: {str(e)}", "error")
+    
+    def _push_url(self, url: str, priority: int) -> bool:
+        """Push a URL onto the frontier heap"""
+        if url in self._queued or url in self.processed_urls:
+            return False
+        heapq.heappush(self._heap, (-priority, next(self._heap_counter), url))
+        self._queued.add(url)
+        return True
+    
     def add_urls_to_queue(self, urls: List[str]):
         """Add URLs to the crawl queue"""
-        for url in urls:
-            if url not in self.processed_urls and url not in [u for u, _ in self.url_queue]:
-                priority = self.get_url_priority(url)
-                self.url_queue.put((url, priority))
-                self.session_stats['discovered_urls'] += 1
+        if self.config.respect_robots_txt:
+            urls = [url for url in urls if self.can_fetch(url)]
         
-        # Sort queue by priority
-        self.url_queue.sort(key=lambda x: x[1], reverse=True)
+        added = 0
+        for url in urls:
+            priority = self.get_url_priority(url)
+            if self._push_url(url, priority):
+                self.discovered_urls.add(url)
+                self.save_url_status(url, "discovered", priority=priority)
+                added += 1
+        if added:
+            self._signal_frontier()
+        self._record_stats({'discovered_urls': added})
         
         # Update progress
         self.update_progress(
             discovered_urls=self.session_stats['discovered_urls'],
-            queue_size=self.url_queue.qsize()
+            queue_size=self.queue_size()
         )
     
-    def get_next_url(self) -> Optional[str]:
-        """Get the next URL to process from priority queue"""
-        with self.lock:
-            while self.priority_queue:
-                priority, url = self.priority_queue.pop(0)
-                
+    def _signal_frontier(self):
+        """Wake workers waiting on the frontier; safe to call from any thread"""
+        loop, ready = self._loop, self._frontier_ready
+        if loop is None or ready is None:
+            return  # Workers not running yet; they check the heap first anyway
+        try:
+            loop.call_soon_threadsafe(ready.set)
+        except RuntimeError:
+            pass  # Loop already closed
+    
+    async def get_next_url(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Pop the highest-priority unprocessed URL, waiting up to timeout seconds"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.stop_crawling:
+            while self._heap:
+                _, _, url = heapq.heappop(self._heap)
+                self._queued.discard(url)
                 if url not in self.processed_urls:
                     return url
-            
-            return None
+            if not self._in_flight:
+                return None  # Nothing queued and no page in flight that could add more
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            self._frontier_ready.clear()
+            try:
+                await asyncio.wait_for(self._frontier_ready.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+        return None
+    
+    def queue_size(self) -> int:
+        """Number of URLs waiting in the frontier"""
+        return len(self._heap)
+    
+    IDLE_TIMEOUT = 120  # backstop: seconds a worker waits on an empty queue while other pages are in flight
+    PROGRESS_EVERY = 10  # pages per worker between progress monitor wakeups
     
-    def worker(self, worker_id: int):
+    async def worker(self, worker_id: int):
         """Enhanced worker with circuit breaker and stuck state detection"""
         self.log_message(f"🚀 Worker {worker_id} started", "info")
         
         consecutive_failures = 0
         max_consecutive_failures = 5  # Circuit breaker threshold
         pages_processed = 0
-        last_progress_time = time.time()
         
-        while not self.stop_crawling and pages_processed < self.config.max_pages:
+        # Loop invariants, looked up once per worker instead of once per page
+        max_pages = self.config.max_pages
+        log = self.log_message
+        mark_processed = self.processed_urls.add
+        save_url_status = self.save_url_status
+        progress_callback = self.progress_callback
+        progress_ready = self._progress_ready
+        
+        while not self.stop_crawling and pages_processed < max_pages:
+            page_stats = Counter()  # applied to session_stats once per page
+            url = None
             try:
                 # Circuit breaker logic
                 if consecutive_failures >= max_consecutive_failures:
-                    self.log_message(f"🔴 Worker {worker_id}: Circuit breaker triggered after {consecutive_failures} consecutive failures. Stopping.", "error")
+                    log(f"🔴 Worker {worker_id}: Circuit breaker triggered after {consecutive_failures} consecutive failures. Stopping.", "error")
                     break
                 
-                # Check for stuck state (no progress for 2 minutes)
-                current_time = time.time()
-                if current_time - last_progress_time > 120:  # 2 minutes
-                    self.log_message(f"⚠️ Worker {worker_id}: No progress for 2 minutes. Checking queue status...", "warning")
-                    if self.url_queue.empty():
-                        self.log_message(f"📭 Worker {worker_id}: Queue is empty. Finishing.", "info")
-                        break
-                    last_progress_time = current_time
-                
-                # Get next URL with timeout
-                try:
-                    url = self.url_queue.get(timeout=30)  # 30 second timeout
-                except queue.Empty:
-                    self.log_message(f"⏰ Worker {worker_id}: Queue timeout. Checking if crawl should continue...", "info")
-                    if self.url_queue.empty():
-                        break
-                    continue
-                
-                # Skip if already processed
-                if url in self.processed_urls:
-                    self.log_message(f"⏭️ Skipping already processed: {url}", "info")
-                    self.url_queue.task_done()
-                    continue
+                # Wait for the next URL; adding URLs (e.g. another worker finishing
+                # a page) or stopping the crawl wakes us immediately
+                url = await self.get_next_url(timeout=self.IDLE_TIMEOUT)
+                if url is None:
+                    if not self.stop_crawling:
+                        log(f"📭 Worker {worker_id}: No URLs left to crawl. Finishing.", "info")
+                    break
+                self._in_flight += 1
                 
                 # Update progress callback with current URL
-                if self.progress_callback:
-                    self.progress_callback({
+                if progress_callback:
+                    progress_callback({
                         'current_url': url,
                         'pages_crawled': len(self.processed_urls),
-                        'queue_size': self.url_queue.qsize(),
+                        'queue_size': self.queue_size(),
                         'status': 'processing'
                     })
                 
-                self.log_message(f"🔄 Processing: {url}", "info")
+                log(f"🔄 Processing: {url}", "info")
                 
                 # Fetch the page
-                result = self.fetch_page(url)
+                fetch_started = time.monotonic()
+                result = await self.fetch_page(url)
                 
-                if result:
-                    soup, content = result
+                if result and result.unchanged:
+                    # Nothing new to archive or discover
+                    page_stats['pages_crawled'] += 1
+                
+                elif result:
+                    page = result.page
                     
-                    # Archive the page using the existing method
-                    chunks = self.archive_page(url, content, soup)
+                    # Archive the page using the existing method; extraction and
+                    # knowledge base writes are blocking, so run them in a thread
+                    chunks = await self._run_blocking(self.archive_page, url, result.body, page)
                     
                     if chunks > 0:
-                        self.log_message(f"✅ Archived {chunks} data chunks", "success")
+                        log(f"✅ Archived {chunks} data chunks", "success")
                         consecutive_failures = 0  # Reset failure counter on success
                         pages_processed += 1
-                        last_progress_time = current_time
+                        if pages_processed % self.PROGRESS_EVERY == 0:
+                            progress_ready.set()
                         
                         # Update session stats
-                        self.session_stats['pages_crawled'] += 1
-                        self.session_stats['pages_archived'] += 1
-                        self.session_stats['chunks_added'] += chunks
+                        page_stats['pages_crawled'] += 1
+                        page_stats['pages_archived'] += 1
+                        page_stats['chunks_added'] += chunks
                         
                     else:
-                        self.log_message(f"⚠️ No data chunks found in {url}", "warning")
+                        log(f"⚠️ No data chunks found in {url}", "warning")
                         consecutive_failures += 1
                     
                     # Discover new URLs (limit to prevent queue explosion)
-                    if self.url_queue.qsize() < 100:  # Limit queue size
-                        new_urls = self.discover_urls_from_page(url, soup)
-                        for new_url in new_urls[:10]:  # Limit new URLs per page
-                            if new_url not in self.processed_urls:
-                                self.url_queue.put(new_url)
-                                self.session_stats['discovered_urls'] += 1
+                    if self.queue_size() < 100:  # Limit queue size
+                        new_urls = self.discover_urls_from_page(url, page)
+                        self.add_urls_to_queue(new_urls[:10])  # Limit new URLs per page
                 else:
                     consecutive_failures += 1
-                    self.session_stats['errors'] += 1
-                    self.log_message(f"❌ Failed to process {url} (failure #{consecutive_failures})", "error")
+                    page_stats['errors'] += 1
+                    log(f"❌ Failed to process {url} (failure #{consecutive_failures})", "error")
                 
                 # Mark as processed
-                self.processed_urls.add(url)
-                self.url_queue.task_done()
+                mark_processed(url)
                 
                 # Save URL status to database
-                self.save_url_status(url, "completed" if result else "failed")
+                if result:
+                    save_url_status(
+                        url, "unchanged" if result.unchanged else "completed",
+                        content_hash=result.content_hash, etag=result.etag, last_modified=result.last_modified
+                    )
+                else:
+                    save_url_status(url, "failed")
                 
                 # Update progress
-                if self.progress_callback:
-                    self.progress_callback({
+                if progress_callback:
+                    progress_callback({
                         'pages_crawled': len(self.processed_urls),
-                        'queue_size': self.url_queue.qsize(),
+                        'queue_size': self.queue_size(),
                         'consecutive_failures': consecutive_failures,
                         'status': 'active'
                     })
                 
                 # Delay between requests
-                self.log_message(f"⏱️ Waiting {self.config.delay_between_requests}s before next request...", "info")
-                time.sleep(self.config.delay_between_requests)
+                await self.wait_for_next_request(fetch_started)
                 
             except Exception as e:
                 consecutive_failures += 1
-                self.session_stats['errors'] += 1
-                self.log_message(f"💥 Worker {worker_id} error: {str(e)[:100]}", "error")
-                time.sleep(5)  # Brief pause on error
+                page_stats['errors'] += 1
+                log(f"💥 Worker {worker_id} error: {str(e)[:100]}", "error")
+                await asyncio.sleep(5)  # Brief pause on error
+            
+            finally:
+                if page_stats:
+                    self._record_stats(page_stats)
+                if url is not None:
+                    self._in_flight -= 1
+                    if not self._in_flight and not self._heap:
+                        self._signal_frontier()  # let idle workers see the crawl is done
         
         # Worker finished
-        if pages_processed >= self.config.max_pages:
-            self.log_message(f"📊 Worker {worker_id}: Max pages limit reached ({pages_processed} pages)", "info")
+        if pages_processed >= max_pages:
+            log(f"📊 Worker {worker_id}: Max pages limit reached ({pages_processed} pages)", "info")
         elif consecutive_failures >= max_consecutive_failures:
-            self.log_message(f"🔴 Worker {worker_id}: Stopped due to circuit breaker", "error")
+            log(f"🔴 Worker {worker_id}: Stopped due to circuit breaker", "error")
         else:
-            self.log_message(f"✅ Worker {worker_id}: Completed normally ({pages_processed} pages)", "success")
+            log(f"✅ Worker {worker_id}: Completed normally ({pages_processed} pages)", "success")
         
-        self.log_message(f"🏁 Worker {worker_id} finished", "info")
+        log(f"🏁 Worker {worker_id} finished", "info")
     
-    def start_crawl(self, seed_urls: List[str] = None) -> Dict:
+    def start_crawl(self, seed_urls: Iterable[str] = None) -> Dict:
         """
         Start crawling with enhanced monitoring and circuit breaker protection
         """
@@ -756,10 +1283,10 @@ class BasketballReferenceCrawler:
             self.stop_crawling = False
             
             # Initialize with seed URLs
+            # Seeds may be a lazy iterator; never take more than the crawl could use
             if seed_urls:
-                for url in seed_urls:
-                    if url not in self.processed_urls:
-                        self.url_queue.put(url)
+                seed_urls = list(itertools.islice(seed_urls, self.config.max_pages * 2))
+                self.add_urls_to_queue(seed_urls)
                 self.log_message(f"🌱 Added {len(seed_urls)} seed URLs to queue", "success")
             
             # Load existing crawl state
@@ -768,48 +1295,14 @@ class BasketballReferenceCrawler:
             # Update initial progress
             self.update_progress(
                 pages_crawled=len(self.processed_urls),
-                queue_size=self.url_queue.qsize(),
+                queue_size=self.queue_size(),
                 status='starting'
             )
             
-            # Start worker thread
-            self.log_message(f"🔧 Starting {self.config.max_concurrent_threads} worker thread(s)", "info")
-            
-            import threading
-            worker_threads = []
-            
-            for i in range(self.config.max_concurrent_threads):
-                thread = threading.Thread(target=self.worker, args=(i,))
-                thread.daemon = True
-                thread.start()
-                worker_threads.append(thread)
-            
-            # Monitor progress
-            self.log_message("📊 Monitoring crawler progress...", "info")
-            
-            # Wait for workers to complete or timeout
+            # Run the workers as coroutines on one event loop
+            self.log_message(f"🔧 Starting {self.config.max_concurrent_threads} worker(s)", "info")
             start_time = time.time()
-            max_runtime = 3600  # 1 hour maximum
-            
-            while any(thread.is_alive() for thread in worker_threads) and not self.stop_crawling:
-                time.sleep(10)  # Check every 10 seconds
-                
-                # Update progress
-                self.update_progress(
-                    pages_crawled=len(self.processed_urls),
-                    queue_size=self.url_queue.qsize(),
-                    runtime=time.time() - start_time
-                )
-                
-                # Safety timeout
-                if time.time() - start_time > max_runtime:
-                    self.log_message("⏰ Maximum runtime reached. Stopping crawler.", "warning")
-                    self.stop_crawling = True
-                    break
-            
-            # Wait for threads to finish gracefully
-            for thread in worker_threads:
-                thread.join(timeout=30)
+            asyncio.run(self._run_workers(start_time))
             
             # Final statistics
             final_stats = {
@@ -833,56 +1326,141 @@ class BasketballReferenceCrawler:
                 'error': str(e),
                 **self.session_stats
             }
+        
+        finally:
+            # Make sure buffered knowledge base pages and queued DB rows are stored
+            self.flush_knowledge_base()
+            self.flush_url_status()
+    
+    async def _run_workers(self, start_time: float):
+        """Run all workers plus the progress monitor until the workers finish"""
+        workers = self.config.max_concurrent_threads
+        self._loop = asyncio.get_running_loop()
+        self._frontier_ready = asyncio.Event()
+        self._progress_ready = asyncio.Event()
+        self._in_flight = 0
+        self._page_executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawler-page")
+        monitor = asyncio.create_task(self._monitor_progress(start_time))
+        try:
+            await asyncio.gather(*(self.worker(i) for i in range(workers)))
+        finally:
+            monitor.cancel()
+            if self._http is not None:
+                await self._http.close()
+                self._http = None
+            self._page_executor.shutdown(wait=True)
+            self._page_executor = None
+            self._loop = None
+            self._frontier_ready = None
+            self._progress_ready = None
+    
+    async def _run_blocking(self, func: Callable, *args):
+        """Run blocking page work (extraction, embedding) off the event loop"""
+        if self._page_executor is None:
+            return await asyncio.to_thread(func, *args)
+        return await asyncio.get_running_loop().run_in_executor(self._page_executor, func, *args)
+    
+    async def _monitor_progress(self, start_time: float):
+        """Report progress periodically and enforce the maximum runtime"""
+        self.log_message("📊 Monitoring crawler progress...", "info")
+        max_runtime = 3600  # 1 hour maximum
+        progress_ready = self._progress_ready
+        
+        while not self.stop_crawling:
+            # Workers signal every PROGRESS_EVERY pages; the timeout only
+            # exists to enforce max_runtime, so an idle crawl reports nothing
+            try:
+                await asyncio.wait_for(progress_ready.wait(), 10)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                progress_ready.clear()
+                self.update_progress(
+                    pages_crawled=len(self.processed_urls),
+                    queue_size=self.queue_size(),
+                    runtime=time.time() - start_time
+                )
+            
+            # Safety timeout
+            if time.time() - start_time > max_runtime:
+                self.log_message("⏰ Maximum runtime reached. Stopping crawler.", "warning")
+                self.stop_crawl()
+                break
     
     def stop_crawl(self):
         """Stop the crawling process gracefully"""
         self.log_message("🛑 Stopping crawler...", "warning")
         self.stop_crawling = True
         
+        # Wake workers blocked on an empty queue so they can exit
+        self._signal_frontier()
+        
+        # Persist everything recorded so far; the instance stays usable
+        # (statistics, another start_crawl) until close() is called
+        self.flush_url_status()
+        
         # Update progress to show stopped status
         if self.progress_callback:
             self.progress_callback({
                 'status': 'stopped',
                 'pages_crawled': len(self.processed_urls),
-                'queue_size': self.url_queue.qsize()
+                'queue_size': self.queue_size()
             })
     
+    def close(self):
+        """
+        Write out queued rows, stop the writer thread and close the database.
+        Call this once the crawler is no longer needed; stopping a crawl does not.
+        """
+        if self._db is None:
+            return
+        atexit.unregister(self.close)
+        self._write_queue.put(None)
+        self._writer_thread.join(timeout=30)
+        with self._lookup_lock:
+            self._lookup_db.close()
+        with self._db_lock:
+            self._db.close()
+            self._db = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
     def get_crawl_statistics(self) -> Dict:
         """Get comprehensive crawl statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # URL status counts
-                cursor.execute("SELECT status, COUNT(*) FROM urls GROUP BY status")
-                status_counts = dict(cursor.fetchall())
-                
-                # Recent activity
-                cursor.execute("""
-                    SELECT COUNT(*) FROM urls 
-                    WHERE processed_at > datetime('now', '-24 hours')
-                """)
-                recent_activity = cursor.fetchone()[0]
-                
-                # Top categories by chunk count
-                cursor.execute("""
-                    SELECT category, SUM(chunk_count) as total_chunks
-                    FROM archived_pages 
-                    GROUP BY category 
-                    ORDER BY total_chunks DESC 
-                    LIMIT 10
-                """)
-                top_categories = cursor.fetchall()
-                
-                return {
-                    'current_session': self.session_stats,
-                    'url_status_counts': status_counts,
-                    'recent_activity_24h': recent_activity,
-                    'top_categories': top_categories,
-                    'total_discovered': len(self.discovered_urls) if hasattr(self, 'discovered_urls') else 0,
-                    'total_processed': len(self.processed_urls) if hasattr(self, 'processed_urls') else 0,
-                    'queue_size': self.url_queue.qsize() if hasattr(self, 'url_queue') and hasattr(self.url_queue, 'qsize') else 0
-                }
+            self.flush_url_status()
+            
+            # URL status counts
+            status_counts = dict(self._exec("SELECT status, COUNT(*) FROM urls GROUP BY status"))
+            
+            # Recent activity
+            recent_activity = self._exec("""
+                SELECT COUNT(*) FROM urls 
+                WHERE processed_at > datetime('now', '-24 hours')
+            """)[0][0]
+            
+            # Top categories by chunk count
+            top_categories = self._exec("""
+                SELECT category, SUM(chunk_count) as total_chunks
+                FROM archived_pages 
+                GROUP BY category 
+                ORDER BY total_chunks DESC 
+                LIMIT 10
+            """)
+            
+            return {
+                'current_session': self.session_stats,
+                'url_status_counts': status_counts,
+                'recent_activity_24h': recent_activity,
+                'top_categories': top_categories,
+                'total_discovered': len(self.discovered_urls) if hasattr(self, 'discovered_urls') else 0,
+                'total_processed': len(self.processed_urls) if hasattr(self, 'processed_urls') else 0,
+                'queue_size': self.queue_size()
+            }
         
         except Exception as e:
             self.log_message(f"❌ Error getting statistics: {str(e)}", "error")
@@ -894,7 +1472,7 @@ class BasketballReferenceCrawler:
                 'top_categories': [],
                 'total_discovered': len(self.discovered_urls) if hasattr(self, 'discovered_urls') else 0,
                 'total_processed': len(self.processed_urls) if hasattr(self, 'processed_urls') else 0,
-                'queue_size': self.url_queue.qsize() if hasattr(self, 'url_queue') and hasattr(self.url_queue, 'qsize') else 0
+                'queue_size': self.queue_size()
             }
     
     def pause_crawl(self):
@@ -907,7 +1485,7 @@ class BasketballReferenceCrawler:
         # Load state and continue
         pass
     
-    def archive_page(self, url: str, content: str, soup: BeautifulSoup) -> int:
+    def archive_page(self, url: str, content: bytes, page: ParsedPage) -> int:
         """
         Archive a page by extracting NBA data and adding to knowledge base
         Returns number of data chunks added
@@ -916,7 +1494,7 @@ class BasketballReferenceCrawler:
             self.log_message(f"📊 Extracting NBA data from: {url}", "info")
             
             # Extract NBA data using existing extraction logic
-            extracted_data = self.extract_nba_data_from_page(soup, url)
+            extracted_data = self.extract_nba_data_from_page(page, url)
             
             if not extracted_data:
                 self.log_message(f"⚠️ No NBA data found in: {url}", "warning")
@@ -939,94 +1517,68 @@ class BasketballReferenceCrawler:
             return 0
     
     def save_archived_page(self, url: str, data: Dict, chunk_count: int):
-        """Save archived page metadata to database"""
+        """Queue archived page metadata for the background writer"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Calculate content hash
-                content_hash = hashlib.md5(str(data).encode()).hexdigest()
-                
-                cursor.execute("""
-                    INSERT OR REPLACE INTO archived_pages 
-                    (url, title, content_hash, table_count, chunk_count, category, archived_at)
-                    VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
-                """, (
-                    url,
-                    data.get('title', 'NBA Data'),
-                    content_hash,
-                    data.get('table_count', 0),
-                    chunk_count,
-                    self.categorize_url(url)
-                ))
-                
+            # Calculate content hash
+            content_hash = data_content_hash(data)
+            
+            self._write_queue.put(('archived_pages', (
+                url,
+                data.get('title', 'NBA Data'),
+                content_hash,
+                data.get('table_count', 0),
+                chunk_count,
+                self.categorize_url(url)
+            )))
+            
         except Exception as e:
             self.log_message(f"❌ Error saving archive metadata: {str(e)}", "error")
     
     def categorize_url(self, url: str) -> str:
         """Categorize URL for better organization"""
-        if '/leagues/' in url:
-            if '_per_game' in url:
-                return 'Player Statistics'
-            elif '_totals' in url:
-                return 'Player Totals'
-            elif '_advanced' in url:
-                return 'Advanced Stats'
-            else:
-                return 'Season Overview'
-        elif '/teams/' in url:
-            return 'Team Pages'
-        elif '/players/' in url:
-            return 'Player Pages'
-        elif '/playoffs/' in url:
-            return 'Playoff Data'
-        elif '/awards/' in url:
-            return 'Awards & Honors'
-        else:
-            return 'General NBA Data'
+        parts = urlsplit(url).path.split('/', 2)
+        section = parts[1] if len(parts) > 2 else ''  # only directories, e.g. /teams/...
+        if section == 'leagues':
+            page = _LEAGUE_PAGE_RE.search(parts[2])
+            return _LEAGUE_CATEGORIES[page.group(1)] if page else 'Season Overview'
+        return _SECTION_CATEGORIES.get(section, 'General NBA Data')
 
-def get_basketball_reference_seed_urls() -> List[str]:
-    """Get comprehensive seed URLs for Basketball-Reference.com crawling"""
+def get_basketball_reference_seed_urls() -> Iterator[str]:
+    """Yield comprehensive seed URLs for Basketball-Reference.com crawling, most important first"""
     current_year = datetime.now().year
+    base = "https://www.basketball-reference.com"
     
-    seed_urls = [
-        # Main NBA pages
-        "https://www.basketball-reference.com/",
-        "https://www.basketball-reference.com/leagues/",
-        "https://www.basketball-reference.com/players/",
-        "https://www.basketball-reference.com/teams/",
-        "https://www.basketball-reference.com/playoffs/",
-        "https://www.basketball-reference.com/awards/",
-        "https://www.basketball-reference.com/leaders/",
-        
-        # Recent seasons (last 10 years)
-        *[f"https://www.basketball-reference.com/leagues/NBA_{year}.html" 
-          for year in range(current_year - 10, current_year + 1)],
-        
-        # Player statistics by season
-        *[f"https://www.basketball-reference.com/leagues/NBA_{year}_per_game.html" 
-          for year in range(current_year - 5, current_year + 1)],
-        *[f"https://www.basketball-reference.com/leagues/NBA_{year}_totals.html" 
-          for year in range(current_year - 5, current_year + 1)],
-        *[f"https://www.basketball-reference.com/leagues/NBA_{year}_advanced.html" 
-          for year in range(current_year - 5, current_year + 1)],
-        
-        # Team pages for current season
-        *[f"https://www.basketball-reference.com/teams/{team}/{current_year}.html" 
-          for team in ['LAL', 'GSW', 'BOS', 'MIA', 'CHI', 'NYK', 'LAC', 'PHI', 'BRK', 'TOR',
-                      'MIL', 'IND', 'ATL', 'ORL', 'WAS', 'CHA', 'DET', 'CLE', 'DEN', 'MIN',
-                      'OKC', 'POR', 'UTA', 'NOP', 'SAS', 'DAL', 'MEM', 'HOU', 'SAC', 'PHO']],
-        
-        # Playoff pages
-        *[f"https://www.basketball-reference.com/playoffs/NBA_{year}.html" 
-          for year in range(current_year - 5, current_year + 1)],
-        
-        # Awards and leaders
-        *[f"https://www.basketball-reference.com/awards/awards_{year}.html" 
-          for year in range(current_year - 5, current_year + 1)],
-    ]
+    # Main NBA pages
+    yield f"{base}/"
+    yield f"{base}/leagues/"
+    yield f"{base}/players/"
+    yield f"{base}/teams/"
+    yield f"{base}/playoffs/"
+    yield f"{base}/awards/"
+    yield f"{base}/leaders/"
+    
+    # Recent seasons (last 10 years)
+    for year in range(current_year - 10, current_year + 1):
+        yield f"{base}/leagues/NBA_{year}.html"
+    
+    # Player statistics by season
+    for page in ('per_game', 'totals', 'advanced'):
+        for year in range(current_year - 5, current_year + 1):
+            yield f"{base}/leagues/NBA_{year}_{page}.html"
+    
+    # Team pages for current season
+    for team in ['LAL', 'GSW', 'BOS', 'MIA', 'CHI', 'NYK', 'LAC', 'PHI', 'BRK', 'TOR',
+                 'MIL', 'IND', 'ATL', 'ORL', 'WAS', 'CHA', 'DET', 'CLE', 'DEN', 'MIN',
+                 'OKC', 'POR', 'UTA', 'NOP', 'SAS', 'DAL', 'MEM', 'HOU', 'SAC', 'PHO']:
+        yield f"{base}/teams/{team}/{current_year}.html"
+    
+    # Playoff pages
+    for year in range(current_year - 5, current_year + 1):
+        yield f"{base}/playoffs/NBA_{year}.html"
     
-    return seed_urls
+    # Awards and leaders
+    for year in range(current_year - 5, current_year + 1):
+        yield f"{base}/awards/awards_{year}.html"
 
 # Example usage and testing functions
 def run_sample_crawl():
@@ -1059,4 +1611,5 @@ def run_sample_crawl():
 
 if __name__ == "__main__":
     # Run sample crawl
-    crawler = run_sample_crawl() 
\ No newline at end of file
+    crawler = run_sample_crawl()
+    crawler.close() 
\ No newline at end of file
@@ -10,37 +10,90 @@ Usage:
 """
 
 import os
-import base64
+import binascii
+import sqlite3
+from contextlib import closing
 from pathlib import Path
-from telethon.sessions import StringSession
-from telethon import TelegramClient
+
+# Optional: pybase64 encodes straight into a str (stdlib needs a bytes copy)
+try:
+    from pybase64 import b64encode_as_string
+except ImportError:
+    def b64encode_as_string(data: bytes) -> str:
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+SESSION_NAME = 'daredevil_session'
+SESSION_FILE = f"{SESSION_NAME}.session"
+B64_OUTPUT_FILE = 'TELEGRAM_SESSION_B64.txt'
+
+def _session_stat():
+    """Stat the session file once; None if it is missing or empty"""
+    try:
+        st = Path(SESSION_FILE).stat()
+    except FileNotFoundError:
+        print(f"❌ Session file not found: {SESSION_FILE}")
+        return None
+    if st.st_size == 0:
+        print(f"❌ Session file is empty: {SESSION_FILE}")
+        return None
+    return st
 
 def extract_string_session():
     """Export compact Telethon StringSession from local session"""
-    api_id = os.getenv('TELEGRAM_API_ID')
-    api_hash = os.getenv('TELEGRAM_API_HASH')
-    if not api_id or not api_hash:
-        print("❌ TELEGRAM_API_ID and TELEGRAM_API_HASH needed to export StringSession")
+    # Already exported (e.g. set as a Railway/CI variable): nothing to do
+    cached = os.getenv('TELEGRAM_STRING_SESSION')
+    if cached:
+        return cached
+
+    if _session_stat() is None:
+        return None
+    # Imported here so the base64 fallback never pays for loading telethon
+    try:
+        from telethon.crypto import AuthKey
+        from telethon.sessions import StringSession
+    except ImportError as e:
+        print(f"❌ telethon is not installed ({e}); cannot build a StringSession")
         return None
     try:
-        with TelegramClient('daredevil_session', int(api_id), api_hash) as client:
-            s = client.session.save()
-            if not isinstance(s, str):
-                s = StringSession.save(client.session)
-            return s
+        # Read only the columns a StringSession encodes straight from the
+        # session database; no client, connection or auth check needed.
+        # Read-only: never takes a write lock, so this works (and can't dirty
+        # the file) while the bot process has the session open
+        uri = f"{Path(SESSION_FILE).resolve().as_uri()}?mode=ro"
+        with closing(sqlite3.connect(uri, uri=True)) as conn:
+            conn.execute("PRAGMA query_only=1")
+            row = conn.execute(
+                "SELECT dc_id, server_address, port, auth_key FROM sessions LIMIT 1"
+            ).fetchone()
+        if not row or not row[3]:
+            print(f"❌ {SESSION_FILE} is not authorized yet - run authenticate_session.py first")
+            return None
+
+        dc_id, server_address, port, auth_key = row
+        session = StringSession()
+        session.set_dc(dc_id, server_address, port)
+        session.auth_key = AuthKey(data=auth_key)
+        return session.save()
     except Exception as e:
         print(f"❌ Failed to export StringSession: {e}")
         return None
 
 def extract_session_data_b64():
     """Encode the entire .session file as base64 (fallback)"""
-    session_file = "daredevil_session.session"
-    if not os.path.exists(session_file):
-        print(f"❌ Session file not found: {session_file}")
+    st = _session_stat()
+    if st is None:
         return None
     try:
-        data = Path(session_file).read_bytes()
-        return base64.b64encode(data).decode("utf-8")
+        # Reuse the previous export if the session file has not changed since
+        output = Path(B64_OUTPUT_FILE)
+        try:
+            if output.stat().st_mtime >= st.st_mtime:
+                return output.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            pass
+
+        data = Path(SESSION_FILE).read_bytes()
+        return b64encode_as_string(data)
     except Exception as e:
         print(f"❌ Error reading session file: {e}")
         return None
@@ -58,8 +111,8 @@ if __name__ == "__main__":
         print("⚠️ Falling back to .session base64 export...")
         auth_b64 = extract_session_data_b64()
         if auth_b64:
-            Path('TELEGRAM_SESSION_B64.txt').write_text(auth_b64, encoding='utf-8')
-            print("✅ Wrote TELEGRAM_SESSION_B64.txt")
+            Path(B64_OUTPUT_FILE).write_text(auth_b64, encoding='utf-8')
+            print(f"✅ Wrote {B64_OUTPUT_FILE}")
             print("➡ Use Railway var TELEGRAM_SESSION_B64 with this value")
         else:
             print("❌ Could not export session data")
@@ -2,13 +2,32 @@
 """
 Simple health check script for Railway deployment
 Checks if the Telegram bot dependencies are available
+
+Usage:
+    python health_check.py          # locate modules without importing them
+    python health_check.py --deep   # fully import the bot and its providers
 """
 
 import sys
 import os
+import importlib.util
+
+REQUIRED_MODULES = ('telegram_bot_rag', 'telethon', 'openai', 'llm_provider', 'voice_processor')
+
+def check_dependencies(deep: bool = False):
+    """Check if all required dependencies are available
 
-def check_dependencies():
-    """Check if all required dependencies are available"""
+    By default only locates each module, which skips the bot's import-time
+    setup (clients, databases, embeddings). ``deep`` imports them for real.
+    """
+    if not deep:
+        missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+        if missing:
+            print(f"❌ Missing modules: {', '.join(missing)}")
+            return False
+        print("✅ All dependencies found")
+        return True
+    
     try:
         import telegram_bot_rag
         import telethon
@@ -49,7 +68,7 @@ def main():
     """Main health check function"""
     print("🔍 Running health check...")
     
-    deps_ok = check_dependencies()
+    deps_ok = check_dependencies(deep='--deep' in sys.argv[1:])
     env_ok = check_environment()
     
     if deps_ok and env_ok:
@@ -1,54 +1,110 @@
 #!/usr/bin/env python3
 """
 Simple health check server for Railway deployment
-Provides a /health endpoint that Railway can use for health checks
+Provides a /health endpoint that Railway can use for health checks.
+The bot serves it from a thread with its own asyncio loop, so a slow LLM or
+vector store call blocking the bot's loop cannot fail the health check.
 """
 
+import asyncio
 import threading
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
 import os
+from typing import Optional
+from aiohttp import web
 
-class HealthHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        try:
-            if self.path == '/health':
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                response = b'{"status": "healthy", "service": "telegram-bot", "timestamp": "' + str(int(time.time())).encode() + b'"}'
-                self.wfile.write(response)
-                print(f"✅ Health check successful - {self.path}")
-            else:
-                self.send_response(404)
-                self.end_headers()
-                print(f"❌ Health check failed - Invalid path: {self.path}")
-        except Exception as e:
-            print(f"❌ Health check error: {e}")
-            try:
-                self.send_response(500)
-                self.end_headers()
-            except:
-                pass
-
-    def log_message(self, format, *args):
-        # Suppress default logging but allow our custom prints
-        pass
+# The body only changes with the timestamp, so it is rebuilt at most once a second
+_BODY_PREFIX = b'{"status": "healthy", "service": "telegram-bot", "timestamp": "'
+_BODY_SUFFIX = b'"}'
+_HEADERS = {'Access-Control-Allow-Origin': '*'}
+_cached_ts = 0
+_cached_body = b''
+
+async def health(request: web.Request) -> web.Response:
+    """Report the bot process as healthy"""
+    global _cached_ts, _cached_body
+    now = int(time.time())
+    if now != _cached_ts:
+        _cached_ts = now
+        _cached_body = b'%s%d%s' % (_BODY_PREFIX, now, _BODY_SUFFIX)
+    print(f"✅ Health check successful - {request.path}")
+    return web.Response(body=_cached_body, content_type='application/json', headers=_HEADERS)
 
-def start_health_server():
-    """Start the health check server in a separate thread"""
+def create_health_app() -> web.Application:
+    """Build the aiohttp application serving /health"""
+    app = web.Application()
+    app.router.add_get('/health', health)
+    return app
+
+async def start_health_server() -> Optional[web.AppRunner]:
+    """Start the health check server on the running event loop
+
+    Returns the runner so the caller can ``await runner.cleanup()`` on
+    shutdown, or None if the server could not be started.
+    """
     try:
         # Use Railway's PORT environment variable if available, otherwise 8080
         port = int(os.environ.get('PORT', os.environ.get('HEALTH_CHECK_PORT', '8080')))
-        server = HTTPServer(('0.0.0.0', port), HealthHandler)
+        runner = web.AppRunner(create_health_app(), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, '0.0.0.0', port).start()
         print(f"🏥 Health check server started on port {port}")
         print(f"🏥 Health endpoint available at: http://0.0.0.0:{port}/health")
-        server.serve_forever()
+        return runner
     except Exception as e:
         print(f"❌ Failed to start health server: {e}")
         import traceback
         traceback.print_exc()
+        return None
+
+class HealthServerThread(threading.Thread):
+    """Runs the health check server on a private event loop"""
+    
+    def __init__(self):
+        super().__init__(name="health-server", daemon=True)
+        self.loop = asyncio.new_event_loop()
+        self.runner: Optional[web.AppRunner] = None
+        self.ready = threading.Event()
+    
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.runner = self.loop.run_until_complete(start_health_server())
+            self.ready.set()
+            if self.runner is not None:
+                self.loop.run_forever()
+                self.loop.run_until_complete(self.runner.cleanup())
+        finally:
+            self.ready.set()
+            self.loop.close()
+    
+    def stop(self):
+        """Shut the server down and wait for its thread to exit"""
+        if self.runner is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.join(timeout=5)
+
+def start_health_server_thread() -> Optional[HealthServerThread]:
+    """Start the health check server on its own thread
+    
+    Returns once the server is listening, or None if it could not start.
+    """
+    server = HealthServerThread()
+    server.start()
+    server.ready.wait()
+    return server if server.runner is not None else None
+
+async def _serve_forever():
+    runner = await start_health_server()
+    if runner is None:
+        return
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
 
 if __name__ == "__main__":
-    start_health_server()
+    try:
+        asyncio.run(_serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -10,74 +10,159 @@ This script helps set up the Agent Daredevil Telegram bot by:
 
 Usage:
     python install.py
+    python install.py --check-only [--quiet]   # exit 0 if already set up, 1 if not
 """
 
-import os
 import sys
-import subprocess
+import argparse
 import shutil
+import shlex
 import asyncio
+import threading
+import importlib
+import importlib.metadata
+import re
+import hashlib
 from pathlib import Path
 
-# ANSI colors for terminal output
-class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
+from _colors import HEADER, BLUE, CYAN, GREEN, YELLOW, RED, ENDC
 
-def print_colored(text, color):
+def print_colored(text, color, flush=False):
     """Print colored text to terminal."""
-    print(f"{color}{text}{Colors.ENDC}")
+    print(f"{color}{text}{ENDC}", flush=flush)
+
+def render_colored(lines):
+    """Pre-render (text, color) lines into one string for a single write."""
+    return "".join(f"{color}{text}{ENDC}\n" for text, color in lines)
 
 def print_header(text):
     """Print a formatted header."""
+    sys.stdout.flush()  # Phase boundary: write out the previous phase
     print("\n")
-    print_colored("=" * 60, Colors.HEADER)
-    print_colored(f" {text}", Colors.HEADER)
-    print_colored("=" * 60, Colors.HEADER)
+    print_colored("=" * 60, HEADER)
+    print_colored(f" {text}", HEADER)
+    print_colored("=" * 60, HEADER)
 
-def run_command(command, explanation=None):
-    """Run a shell command and return success status."""
+async def run_command(command, explanation=None, output=None):
+    """Run a command (argument list, no shell) and return success status.
+    
+    Output is streamed as it arrives, or appended to the ``output`` list
+    when the caller will show it later (e.g. while prompts are on screen).
+    """
     if explanation:
-        print_colored(f"\n{explanation}", Colors.BLUE)
+        print_colored(f"\n{explanation}", BLUE)
     
-    print_colored(f"$ {command}", Colors.CYAN)
+    print_colored(f"$ {shlex.join(command)}", CYAN, flush=True)
     
     try:
-        result = subprocess.run(command, shell=True, check=True, text=True, 
-                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        print_colored(result.stdout, Colors.ENDC)
-        return True
-    except subprocess.CalledProcessError as e:
-        print_colored(f"Error: {e}", Colors.RED)
-        print_colored(e.stderr, Colors.RED)
+        # Keep this call on subprocess's posix_spawn fast path: command[0] must
+        # contain a directory (sys.executable does), close_fds=False (safe:
+        # Python's own fds are non-inheritable), and no preexec_fn, cwd,
+        # pass_fds or start_new_session. Any of those falls back to fork+exec.
+        proc = await asyncio.create_subprocess_exec(
+            *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+            close_fds=False)
+    except OSError as e:
+        print_colored(f"Error: {e}", RED)
         return False
+    
+    async for line in proc.stdout:
+        text = line.decode(errors="replace")
+        if output is None:
+            print(text, end="", flush=True)
+        else:
+            output.append(text)
+    
+    returncode = await proc.wait()
+    if returncode != 0:
+        message = f"Error: command exited with status {returncode}"
+        if output is None:
+            print_colored(message, RED)
+        else:
+            output.append(f"{RED}{message}{ENDC}\n")
+        return False
+    return True
+
+# Stamps recording what this machine has already installed, so re-running
+# the installer skips pip entirely when nothing changed
+INSTALL_CACHE_DIR = Path.home() / ".cache" / "agent-daredevil"
+
+def install_stamp(spec):
+    """Stamp path for installing spec (bytes) into the running interpreter."""
+    digest = hashlib.sha256(sys.executable.encode() + b"\0" + spec).hexdigest()
+    return INSTALL_CACHE_DIR / f"installed-{digest}.stamp"
+
+def write_install_stamp(stamp):
+    """Record a successful install; failing to write it is harmless."""
+    try:
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+    except OSError:
+        pass
 
-def install_dependencies():
-    """Install required Python dependencies."""
+# Requirement names: the leading project name of each non-comment line
+REQUIREMENT_NAME_RE = re.compile(r"^[ \t]*([A-Za-z0-9][A-Za-z0-9._-]*)", re.MULTILINE)
+
+def missing_distributions(spec):
+    """Project names in a requirements spec (bytes) that are not installed."""
+    missing = []
+    for name in REQUIREMENT_NAME_RE.findall(spec.decode(errors="replace")):
+        try:
+            importlib.metadata.distribution(name)
+        except importlib.metadata.PackageNotFoundError:
+            missing.append(name)
+    return missing
+
+def install_is_current(stamp, spec):
+    """True when spec was installed before and all of it is still installed.
+    
+    The stamp alone can't see packages uninstalled since, or a virtualenv
+    recreated at the same path.
+    """
+    return stamp.exists() and not missing_distributions(spec)
+
+async def install_dependencies(output=None):
+    """Install required Python dependencies.
+    
+    Everything printed after pip starts goes to the ``output`` list instead
+    when one is given, so the install can run behind interactive prompts.
+    """
     print_header("Installing Dependencies")
     
-    # Check if requirements.txt exists
-    if not os.path.exists("requirements.txt"):
-        print_colored("requirements.txt not found!", Colors.RED)
+    # Read requirements.txt directly; a missing file is the only error to expect
+    try:
+        requirements = Path("requirements.txt").read_bytes()
+    except FileNotFoundError:
+        print_colored("requirements.txt not found!", RED)
         return False
     
-    # Install dependencies
-    success = run_command("pip install -r requirements.txt", 
-                         "Installing required packages...")
+    stamp = install_stamp(requirements)
+    if install_is_current(stamp, requirements):
+        print_colored("✅ requirements.txt unchanged since the last install, skipping pip.", GREEN)
+        print_colored(f"   (delete {stamp} to force a reinstall)", YELLOW)
+        return True
+    
+    # Install dependencies with this interpreter's pip, skipping its
+    # startup version check
+    success = await run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt",
+                                 "--no-input", "--disable-pip-version-check", "-q"],
+                                "Installing required packages...", output)
     
     if success:
-        print_colored("\n✅ Dependencies installed successfully!", Colors.GREEN)
+        write_install_stamp(stamp)
+        result = ("\n✅ Dependencies installed successfully!", GREEN)
+    else:
+        result = ("\n❌ Failed to install dependencies.", RED)
+    if output is None:
+        print_colored(*result)
     else:
-        print_colored("\n❌ Failed to install dependencies.", Colors.RED)
+        output.append(f"{result[1]}{result[0]}{ENDC}\n")
     
     return success
 
+# KEY=value assignment lines in a .env file; group 1 is the key
+ENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[^\n]*", re.MULTILINE)
+
 def setup_env_file():
     """Set up the .env configuration file."""
     print_header("Setting Up Environment Configuration")
@@ -87,180 +172,286 @@ def setup_env_file():
     
     # Check if .env already exists
     if env_path.exists():
-        print_colored(".env file already exists.", Colors.YELLOW)
+        print_colored(".env file already exists.", YELLOW)
         overwrite = input("Overwrite existing .env file? (y/n): ").lower() == 'y'
         if not overwrite:
-            print_colored("Keeping existing .env file.", Colors.BLUE)
+            print_colored("Keeping existing .env file.", BLUE)
             return True
     
     # Check if env.example exists
     if not env_example_path.exists():
-        print_colored("env.example not found! Cannot create .env file.", Colors.RED)
+        print_colored("env.example not found! Cannot create .env file.", RED)
         return False
     
     # Copy env.example to .env
     shutil.copy(env_example_path, env_path)
-    print_colored("Created .env file from template.", Colors.GREEN)
+    print_colored("Created .env file from template.", GREEN)
     
     # Ask for configuration values
-    print_colored("\nLet's configure your .env file:", Colors.BLUE)
+    print_colored("\nLet's configure your .env file:", BLUE)
     
     # Telegram configuration
-    print_colored("\nTelegram Configuration:", Colors.CYAN)
-    print_colored("Get these values from https://my.telegram.org/apps", Colors.YELLOW)
+    print_colored("\nTelegram Configuration:", CYAN)
+    print_colored("Get these values from https://my.telegram.org/apps", YELLOW)
     telegram_api_id = input("Telegram API ID: ").strip()
     telegram_api_hash = input("Telegram API Hash: ").strip()
     telegram_phone = input("Telegram Phone Number (with country code, e.g. +1234567890): ").strip()
+    updates = {
+        "TELEGRAM_API_ID": telegram_api_id,
+        "TELEGRAM_API_HASH": telegram_api_hash,
+        "TELEGRAM_PHONE_NUMBER": telegram_phone,
+    }
     
     # LLM Provider selection
-    print_colored("\nLLM Provider Selection:", Colors.CYAN)
-    print_colored("1. OpenAI (GPT-4)", Colors.ENDC)
-    print_colored("2. Google Gemini (Recommended: gemini-2.5-flash)", Colors.ENDC)
-    print_colored("3. Vertex AI (Google Cloud)", Colors.ENDC)
+    print_colored("\nLLM Provider Selection:", CYAN)
+    print_colored("1. OpenAI (GPT-4)", ENDC)
+    print_colored("2. Google Gemini (Recommended: gemini-2.5-flash)", ENDC)
+    print_colored("3. Vertex AI (Google Cloud)", ENDC)
     
     provider_choice = input("Choose provider (1-3, default: 2): ").strip() or "2"
     
     if provider_choice == "1":
         provider = "openai"
-        print_colored("\nOpenAI Configuration:", Colors.CYAN)
-        print_colored("Get your API key from https://platform.openai.com/api-keys", Colors.YELLOW)
+        print_colored("\nOpenAI Configuration:", CYAN)
+        print_colored("Get your API key from https://platform.openai.com/api-keys", YELLOW)
         openai_api_key = input("OpenAI API Key: ").strip()
         openai_model = input("OpenAI Model (default: gpt-4): ").strip() or "gpt-4"
+        updates.update(OPENAI_API_KEY=openai_api_key, OPENAI_MODEL=openai_model)
     elif provider_choice == "2":
         provider = "gemini"
-        print_colored("\nGoogle Gemini Configuration:", Colors.CYAN)
-        print_colored("Get your API key from https://makersuite.google.com/app/apikey", Colors.YELLOW)
+        print_colored("\nGoogle Gemini Configuration:", CYAN)
+        print_colored("Get your API key from https://makersuite.google.com/app/apikey", YELLOW)
         google_api_key = input("Google AI API Key: ").strip()
         gemini_model = input("Gemini Model (default: gemini-2.5-flash): ").strip() or "gemini-2.5-flash"
+        updates.update(GOOGLE_AI_API_KEY=google_api_key, GEMINI_MODEL=gemini_model)
     elif provider_choice == "3":
         provider = "vertex_ai"
-        print_colored("\nVertex AI Configuration:", Colors.CYAN)
-        print_colored("Get these from Google Cloud Console", Colors.YELLOW)
+        print_colored("\nVertex AI Configuration:", CYAN)
+        print_colored("Get these from Google Cloud Console", YELLOW)
         project_id = input("Google Cloud Project ID: ").strip()
         location = input("Google Cloud Location (default: us-central1): ").strip() or "us-central1"
         vertex_model = input("Vertex AI Model (default: google/gemini-2.0-flash-001): ").strip() or "google/gemini-2.0-flash-001"
+        updates.update(GOOGLE_CLOUD_PROJECT_ID=project_id, GOOGLE_CLOUD_LOCATION=location, VERTEX_AI_MODEL=vertex_model)
     else:
-        print_colored("Invalid choice. Defaulting to Gemini.", Colors.YELLOW)
+        print_colored("Invalid choice. Defaulting to Gemini.", YELLOW)
         provider = "gemini"
     
-    # Update .env file
-    with open(env_path, "r") as f:
-        env_content = f.readlines()
-    
-    new_env_content = []
-    for line in env_content:
-        if line.startswith("TELEGRAM_API_ID="):
-            new_env_content.append(f"TELEGRAM_API_ID={telegram_api_id}\n")
-        elif line.startswith("TELEGRAM_API_HASH="):
-            new_env_content.append(f"TELEGRAM_API_HASH={telegram_api_hash}\n")
-        elif line.startswith("TELEGRAM_PHONE_NUMBER="):
-            new_env_content.append(f"TELEGRAM_PHONE_NUMBER={telegram_phone}\n")
-        elif line.startswith("LLM_PROVIDER="):
-            new_env_content.append(f"LLM_PROVIDER={provider}\n")
-        elif provider == "openai" and line.startswith("OPENAI_API_KEY="):
-            new_env_content.append(f"OPENAI_API_KEY={openai_api_key}\n")
-        elif provider == "openai" and line.startswith("OPENAI_MODEL="):
-            new_env_content.append(f"OPENAI_MODEL={openai_model}\n")
-        elif provider == "gemini" and line.startswith("GOOGLE_AI_API_KEY="):
-            new_env_content.append(f"GOOGLE_AI_API_KEY={google_api_key}\n")
-        elif provider == "gemini" and line.startswith("GEMINI_MODEL="):
-            new_env_content.append(f"GEMINI_MODEL={gemini_model}\n")
-        elif provider == "vertex_ai" and line.startswith("GOOGLE_CLOUD_PROJECT_ID="):
-            new_env_content.append(f"GOOGLE_CLOUD_PROJECT_ID={project_id}\n")
-        elif provider == "vertex_ai" and line.startswith("GOOGLE_CLOUD_LOCATION="):
-            new_env_content.append(f"GOOGLE_CLOUD_LOCATION={location}\n")
-        elif provider == "vertex_ai" and line.startswith("VERTEX_AI_MODEL="):
-            new_env_content.append(f"VERTEX_AI_MODEL={vertex_model}\n")
-        else:
-            new_env_content.append(line)
+    updates["LLM_PROVIDER"] = provider
+    
+    # Update .env file: one regex pass over the template, replacing the keys
+    # we have values for; keys the template lacks are appended at the end
+    def replace_value(match):
+        key = match.group(1)
+        return f"{key}={updates.pop(key)}" if key in updates else match.group(0)
+    
+    env_content = ENV_LINE_RE.sub(replace_value, env_path.read_text())
+    if updates:
+        if env_content and not env_content.endswith("\n"):
+            env_content += "\n"
+        env_content += "".join(f"{key}={value}\n" for key, value in updates.items())
     
-    with open(env_path, "w") as f:
-        f.writelines(new_env_content)
+    env_path.write_text(env_content)
     
-    print_colored("\n✅ .env file configured successfully!", Colors.GREEN)
+    print_colored("\n✅ .env file configured successfully!", GREEN)
     return True
 
+# KEY=value lines in a .env file, with the value captured (surrounding quotes excluded)
+ENV_VALUE_RE = re.compile(r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*["']?([^"'\n]*)""", re.MULTILINE)
+
+# .env keys the bot needs, and the extra key each LLM provider needs
+REQUIRED_ENV_KEYS = ("TELEGRAM_API_ID", "TELEGRAM_API_HASH", "TELEGRAM_PHONE_NUMBER")
+PROVIDER_ENV_KEYS = {
+    "openai": "OPENAI_API_KEY",
+    "gemini": "GOOGLE_AI_API_KEY",
+    "vertex_ai": "GOOGLE_CLOUD_PROJECT_ID",
+}
+
+def read_env_values(env_path):
+    """Parse KEY=value pairs from a .env file, or return None if it is missing."""
+    try:
+        content = env_path.read_text()
+    except FileNotFoundError:
+        return None
+    return {key: value.strip() for key, value in ENV_VALUE_RE.findall(content)}
+
+def check_configuration(quiet=False):
+    """Check whether a previous run already set everything up, changing nothing.
+    
+    Dependencies count as installed when the stamp for the current
+    requirements.txt exists and every listed package is still installed. .env values still equal to the env.example
+    placeholders count as missing.
+    """
+    problems = []
+    try:
+        requirements = Path("requirements.txt").read_bytes()
+        if not install_is_current(install_stamp(requirements), requirements):
+            problems.append("Dependencies from requirements.txt are not installed")
+    except FileNotFoundError:
+        problems.append("requirements.txt not found")
+    
+    env = read_env_values(Path(".env"))
+    if env is None:
+        problems.append(".env file not found")
+    else:
+        placeholders = read_env_values(Path("env.example")) or {}
+        provider = (env.get("LLM_PROVIDER") or "openai").lower()
+        keys = list(REQUIRED_ENV_KEYS)
+        if provider in PROVIDER_ENV_KEYS:
+            keys.append(PROVIDER_ENV_KEYS[provider])
+        else:
+            problems.append(f"Unknown LLM_PROVIDER in .env: {provider}")
+        for key in keys:
+            value = env.get(key)
+            if not value or value == placeholders.get(key):
+                problems.append(f"{key} is not set in .env")
+    
+    if not quiet:
+        for problem in problems:
+            print_colored(f"❌ {problem}", RED)
+        if not problems:
+            print_colored("✅ Dependencies installed and .env configured.", GREEN)
+    return not problems
+
+# Provider SDKs that llm_provider imports lazily. They are slow to import
+# (gRPC, protobuf) but read no configuration, so they can load while the
+# user is still answering the .env prompts. llm_provider itself is left
+# out: it calls load_dotenv() at import and would pick up the old .env.
+PREWARM_MODULES = ("dotenv", "openai", "google.generativeai")
+
+def prewarm_imports():
+    """Import the provider SDKs ahead of test_llm_provider (best effort)."""
+    importlib.invalidate_caches()  # packages were just installed by pip
+    for name in PREWARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # Not installed or broken; test_llm_provider will report it
+
 async def test_llm_provider():
     """Test the configured LLM provider."""
     print_header("Testing LLM Provider")
     
     try:
-        # Import here to ensure dependencies are installed first
-        from dotenv import load_dotenv
-        load_dotenv()
-        
+        # Import here to ensure dependencies are installed first.
+        # llm_provider loads .env itself when it is first imported.
         from llm_provider import get_llm_provider
         
-        print_colored("Initializing LLM provider...", Colors.BLUE)
+        print_colored("Initializing LLM provider...", BLUE, flush=True)
         provider = get_llm_provider()
-        print_colored(f"✅ Provider initialized: {provider.get_model_name()}", Colors.GREEN)
+        print_colored(f"✅ Provider initialized: {provider.get_model_name()}", GREEN)
         
-        print_colored("\nTesting with a simple query...", Colors.BLUE)
+        print_colored("\nTesting with a simple query...", BLUE, flush=True)
         response = await provider.generate_response(
             messages=[{"role": "user", "content": "Hello, please respond with a short greeting."}],
             max_tokens=100,
             temperature=0.7
         )
         
-        print_colored("\nResponse:", Colors.GREEN)
-        print_colored(response, Colors.ENDC)
+        print_colored("\nResponse:", GREEN)
+        print_colored(response, ENDC)
         
-        print_colored("\n✅ LLM provider test successful!", Colors.GREEN)
+        print_colored("\n✅ LLM provider test successful!", GREEN)
         return True
         
     except Exception as e:
-        print_colored(f"\n❌ Error testing LLM provider: {e}", Colors.RED)
+        print_colored(f"\n❌ Error testing LLM provider: {e}", RED)
         return False
 
+NEXT_STEPS = render_colored([
+    ("1. Run the bot:", CYAN),
+    ("   python telegram_bot_rag.py", YELLOW),
+    ("\n2. Test the LLM provider:", CYAN),
+    ("   python test_all_providers.py --simple", YELLOW),
+    ("\n3. Run comprehensive tests:", CYAN),
+    ("   python test_all_providers.py", YELLOW),
+    ("\n4. Switch to Gemini 2.5 Flash:", CYAN),
+    ("   python switch_to_gemini25.py", YELLOW),
+    ("\n5. Check current provider:", CYAN),
+    ("   python check_llm_provider.py", YELLOW),
+    ("\nFor more information, see:", CYAN),
+    ("- README.md - General overview", YELLOW),
+    ("- LLM_PROVIDER_GUIDE.md - LLM provider documentation", YELLOW),
+    ("- RESPONSE_LENGTH_GUIDE.md - Response length limitation details", YELLOW),
+])
+
 def show_next_steps():
     """Show next steps to the user."""
     print_header("Next Steps")
+    sys.stdout.write(NEXT_STEPS)
+
+def main():
+    """Main installation process."""
+    print_colored("\n🤖 Agent Daredevil Telegram Bot - Installation Helper", HEADER)
+    print_colored("=" * 60, HEADER)
     
-    print_colored("1. Run the bot:", Colors.CYAN)
-    print_colored("   python telegram_bot_rag.py", Colors.YELLOW)
-    
-    print_colored("\n2. Test the LLM provider:", Colors.CYAN)
-    print_colored("   python test_all_providers.py --simple", Colors.YELLOW)
+    # Step 1: Install dependencies, then load the provider SDKs, on a
+    # background thread while the user fills in .env (pip's output is held
+    # back until the prompts are done). The prompts stay on the main thread
+    # and the installer thread is a daemon, so Ctrl+C at a prompt exits
+    # straight away instead of waiting for the install.
+    pip_output = []
+    deps_result = []
+    pip_started = threading.Event()
     
-    print_colored("\n3. Run comprehensive tests:", Colors.CYAN)
-    print_colored("   python test_all_providers.py", Colors.YELLOW)
+    async def start_install():
+        install = asyncio.create_task(install_dependencies(pip_output))
+        await asyncio.sleep(0)  # let it print its header and start pip first
+        pip_started.set()
+        return await install
     
-    print_colored("\n4. Switch to Gemini 2.5 Flash:", Colors.CYAN)
-    print_colored("   python switch_to_gemini25.py", Colors.YELLOW)
+    def install_and_prewarm():
+        try:
+            if asyncio.run(start_install()):
+                prewarm_imports()
+                deps_result.append(True)
+        finally:
+            pip_started.set()
     
-    print_colored("\n5. Check current provider:", Colors.CYAN)
-    print_colored("   python check_llm_provider.py", Colors.YELLOW)
+    installer = threading.Thread(target=install_and_prewarm, name="install-dependencies", daemon=True)
+    installer.start()
+    pip_started.wait()
     
-    print_colored("\nFor more information, see:", Colors.CYAN)
-    print_colored("- README.md - General overview", Colors.YELLOW)
-    print_colored("- LLM_PROVIDER_GUIDE.md - LLM provider documentation", Colors.YELLOW)
-    print_colored("- RESPONSE_LENGTH_GUIDE.md - Response length limitation details", Colors.YELLOW)
-
-async def main():
-    """Main installation process."""
-    print_colored("\n🤖 Agent Daredevil Telegram Bot - Installation Helper", Colors.HEADER)
-    print_colored("=" * 60, Colors.HEADER)
+    # Step 2: Set up .env file
+    env_ok = setup_env_file()
     
-    # Step 1: Install dependencies
-    if not install_dependencies():
-        print_colored("\n❌ Installation failed at dependency installation step.", Colors.RED)
+    installer.join()
+    deps_ok = bool(deps_result)
+    print("".join(pip_output), end="")
+    if not deps_ok:
+        print_colored("\n❌ Installation failed at dependency installation step.", RED)
         return
-    
-    # Step 2: Set up .env file
-    if not setup_env_file():
-        print_colored("\n❌ Installation failed at environment configuration step.", Colors.RED)
+    if not env_ok:
+        print_colored("\n❌ Installation failed at environment configuration step.", RED)
         return
     
     # Step 3: Test LLM provider
-    if not await test_llm_provider():
-        print_colored("\n⚠️ LLM provider test failed. Check your configuration.", Colors.YELLOW)
-        print_colored("You can still proceed, but the bot may not work correctly.", Colors.YELLOW)
+    if not asyncio.run(test_llm_provider()):
+        print_colored("\n⚠️ LLM provider test failed. Check your configuration.", YELLOW)
+        print_colored("You can still proceed, but the bot may not work correctly.", YELLOW)
     
     # Step 4: Show next steps
     show_next_steps()
     
-    print_colored("\n✅ Installation completed successfully!", Colors.GREEN)
-    print_colored("You're now ready to run Agent Daredevil Telegram Bot.", Colors.GREEN)
+    print_colored("\n✅ Installation completed successfully!", GREEN)
+    print_colored("You're now ready to run Agent Daredevil Telegram Bot.", GREEN)
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # Block-buffer stdout; output is flushed at phase boundaries, before
+    # slow steps, and by input() before each prompt. UTF-8 so the emoji
+    # don't raise UnicodeEncodeError when output is redirected on Windows
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace", line_buffering=False)
+    
+    parser = argparse.ArgumentParser(description="Agent Daredevil installation helper")
+    parser.add_argument("--check-only", action="store_true",
+                        help="only check that dependencies and .env are already set up (exit status 0/1)")
+    parser.add_argument("--quiet", action="store_true",
+                        help="with --check-only, print nothing and report through the exit status only")
+    args = parser.parse_args()
+    if args.check_only:
+        sys.exit(0 if check_configuration(args.quiet) else 1)
+    
+    try:
+        main()
+    except KeyboardInterrupt:
+        print_colored("\n\n👋 Installation cancelled by user", YELLOW)
+        sys.exit(130)
\ No newline at end of file
@@ -16,20 +16,13 @@ import sys
 import subprocess
 import time
 import signal
+import socket
 import threading
 import webbrowser
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
-# Try to import psutil, install if missing
-try:
-    import psutil
-except ImportError:
-    print("📦 Installing psutil for process management...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "psutil"])
-    import psutil
-
 class ServiceManager:
     """Manages multiple services with process monitoring and graceful shutdown"""
     
@@ -352,17 +345,22 @@ def check_ports() -> bool:
     return True
 
 def is_port_in_use(port: int) -> bool:
-    """Check if a port is currently in use"""
-    try:
-        for conn in psutil.net_connections():
-            if conn.laddr.port == port:
-                return True
-        return False
-    except:
-        # Fallback method
-        import socket
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            return s.connect_ex(('localhost', port)) == 0
+    """Check if a port is currently in use
+    
+    Tries to bind the port on all interfaces: any server already listening
+    on it, on whatever address, makes bind fail. SO_REUSEADDR (as the
+    services themselves set it) keeps connections left in TIME_WAIT by a
+    just-stopped service from counting; on Windows it would let the bind
+    succeed over a live listener, so it is only set elsewhere.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        if sys.platform != "win32":
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind(('', port))
+        except OSError:
+            return True
+    return False
 
 def create_service_config() -> ServiceManager:
     """Create and configure the service manager"""
@@ -26,6 +26,39 @@ load_dotenv()
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Keep-alive HTTP pool shared by every OpenAI-compatible client, so creating
+# another provider reuses open TLS connections instead of handshaking again.
+# Providers never own it: close() on the client (or on an OpenAI client built
+# on it) is a no-op, and the pool lives until the process exits.
+_http_client = None
+
+def _shared_http_client():
+    """Return the process-wide httpx client for OpenAI-compatible providers."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        import openai
+        base_cls = getattr(openai, 'DefaultHttpxClient', httpx.Client)
+        
+        class SharedHttpClient(base_cls):
+            """httpx client that one provider closing cannot shut for the others"""
+            
+            def close(self):
+                pass
+            
+            def __exit__(self, *exc_info):
+                pass
+        
+        # Keep OpenAI's own timeout (600s reads for long completions) and
+        # connection cap; only idle connections are kept alive for longer
+        limits = httpx.Limits(
+            max_connections=openai.DEFAULT_CONNECTION_LIMITS.max_connections,
+            max_keepalive_connections=10,
+            keepalive_expiry=60,
+        )
+        _http_client = SharedHttpClient(timeout=openai.DEFAULT_TIMEOUT, limits=limits)
+    return _http_client
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
     
@@ -90,7 +123,7 @@ class OpenAIProvider(LLMProvider):
     
     def __init__(self, api_key: str, model: str = "gpt-4"):
         from openai import OpenAI
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=_shared_http_client())
         self.model = model
         logger.info(f"OpenAI provider initialized with model: {model}")
     
@@ -419,6 +452,7 @@ class VertexAIProvider(LLMProvider):
         self.client = openai.OpenAI(
             base_url=f"https://{location}-aiplatform.googleapis.com/v1/projects/{project_id}/locations/{location}/endpoints/openapi",
             api_key=credentials.token,
+            http_client=_shared_http_client(),
         )
         
         self.model = model
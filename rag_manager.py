@@ -22,6 +22,7 @@ import re
 from typing import Dict, List, Optional, Tuple
 import threading
 import queue
+import itertools
 import os
 from dotenv import load_dotenv
 import logging
@@ -371,7 +372,7 @@ def extract_text_from_url(url):
         response.raise_for_status()
         
         # Parse HTML content
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Remove script and style elements
         for script in soup(["script", "style", "nav", "footer", "header", "aside"]):
@@ -632,7 +633,7 @@ def extract_nba_team_stats(url: str) -> Optional[Dict]:
         response = requests.get(url, headers=headers, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Extract page title and context
         title = soup.find('title')
@@ -910,82 +911,92 @@ def generate_generic_table_narrative(table: Dict) -> str:
     except Exception as e:
         return f"Error analyzing table data: {str(e)}"
 
+def build_nba_chunks(nba_data: Dict, custom_title: Optional[str] = None, metadata: Optional[Dict] = None) -> Tuple[List[str], List[Dict]]:
+    """Build the text chunks and per-chunk metadata for one NBA data page (no embedding)"""
+    # Use custom title or generate from data
+    source_name = custom_title if custom_title else f"NBA Data: {nba_data['title']}"
+    
+    # Create multiple representations for better retrieval
+    content_chunks = []
+    
+    # 1. Full narrative text (chunked)
+    narrative_chunks = chunk_text(nba_data['narrative_text'], chunk_size=1200, chunk_overlap=300)
+    content_chunks.extend(narrative_chunks)
+    
+    # 2. Individual table summaries
+    for i, table in enumerate(nba_data.get('tables', []), 1):
+        table_summary = f"NBA Table {i}: {table['title']}\n"
+        table_summary += f"Contains {table['row_count']} rows with columns: {', '.join(table['headers'])}\n\n"
+        
+        # Add sample data
+        if table['rows']:
+            table_summary += "Sample entries:\n"
+            for j, row in enumerate(table['rows'][:5], 1):
+                row_data = []
+                for k, (header, value) in enumerate(zip(table['headers'], row)):
+                    if k < 6:  # First 6 columns
+                        row_data.append(f"{header}: {value}")
+                table_summary += f"{j}. {', '.join(row_data)}\n"
+        
+        content_chunks.append(table_summary)
+    
+    # 3. Key insights summary
+    insights_summary = f"NBA Data Summary from {nba_data['url']}\n"
+    insights_summary += f"Title: {nba_data['title']}\n"
+    insights_summary += f"Contains {len(nba_data.get('tables', []))} data tables\n"
+    insights_summary += f"Extracted on: {nba_data['extraction_timestamp']}\n\n"
+    insights_summary += "This data includes NBA statistics that can be used to answer questions about team performance, player statistics, game schedules, and league standings."
+    
+    content_chunks.append(insights_summary)
+    
+    # Prepare metadata
+    base_metadata = {
+        "source": source_name,
+        "url": nba_data['url'],
+        "source_type": "nba_data",
+        "data_type": "basketball_statistics",
+        "timestamp": datetime.now().isoformat(),
+        "extraction_timestamp": nba_data['extraction_timestamp'],
+        "table_count": len(nba_data.get('tables', [])),
+        "chunk_count": len(content_chunks)
+    }
+    
+    if metadata:
+        base_metadata.update(metadata)
+    
+    metadatas = []
+    for i, chunk in enumerate(content_chunks):
+        chunk_metadata = base_metadata.copy()
+        chunk_metadata["chunk_id"] = i
+        chunk_metadata["chunk_type"] = "narrative" if i < len(narrative_chunks) else "table_summary" if i < len(narrative_chunks) + len(nba_data.get('tables', [])) else "insights"
+        metadatas.append(chunk_metadata)
+    
+    return content_chunks, metadatas
+
+def add_chunks_to_knowledge_base(chunks: List[str], metadatas: List[Dict]) -> int:
+    """Embed and store prepared chunks in a single vector store call"""
+    if not chunks:
+        return 0
+    
+    embeddings = init_embeddings()
+    vectorstore = Chroma(
+        collection_name="telegram_bot_knowledge",
+        embedding_function=embeddings,
+        persist_directory=CHROMA_DB_PATH
+    )
+    vectorstore.add_texts(chunks, metadatas=metadatas)
+    return len(chunks)
+
 def add_nba_data_to_knowledge_base(nba_data: Dict, custom_title: Optional[str] = None, metadata: Optional[Dict] = None) -> Tuple[bool, int, str]:
     """Add NBA data to the knowledge base with optimized chunking"""
     try:
         if not nba_data or not nba_data.get('narrative_text'):
             return False, 0, "No NBA data to process"
         
-        # Use custom title or generate from data
-        source_name = custom_title if custom_title else f"NBA Data: {nba_data['title']}"
-        
-        # Initialize embeddings and vector store
-        embeddings = init_embeddings()
-        vectorstore = Chroma(
-            collection_name="telegram_bot_knowledge",
-            embedding_function=embeddings,
-            persist_directory=CHROMA_DB_PATH
-        )
-        
-        # Create multiple representations for better retrieval
-        content_chunks = []
-        
-        # 1. Full narrative text (chunked)
-        narrative_chunks = chunk_text(nba_data['narrative_text'], chunk_size=1200, chunk_overlap=300)
-        content_chunks.extend(narrative_chunks)
-        
-        # 2. Individual table summaries
-        for i, table in enumerate(nba_data.get('tables', []), 1):
-            table_summary = f"NBA Table {i}: {table['title']}\n"
-            table_summary += f"Contains {table['row_count']} rows with columns: {', '.join(table['headers'])}\n\n"
-            
-            # Add sample data
-            if table['rows']:
-                table_summary += "Sample entries:\n"
-                for j, row in enumerate(table['rows'][:5], 1):
-                    row_data = []
-                    for k, (header, value) in enumerate(zip(table['headers'], row)):
-                        if k < 6:  # First 6 columns
-                            row_data.append(f"{header}: {value}")
-                    table_summary += f"{j}. {', '.join(row_data)}\n"
-            
-            content_chunks.append(table_summary)
-        
-        # 3. Key insights summary
-        insights_summary = f"NBA Data Summary from {nba_data['url']}\n"
-        insights_summary += f"Title: {nba_data['title']}\n"
-        insights_summary += f"Contains {len(nba_data.get('tables', []))} data tables\n"
-        insights_summary += f"Extracted on: {nba_data['extraction_timestamp']}\n\n"
-        insights_summary += "This data includes NBA statistics that can be used to answer questions about team performance, player statistics, game schedules, and league standings."
-        
-        content_chunks.append(insights_summary)
-        
-        # Prepare metadata
-        base_metadata = {
-            "source": source_name,
-            "url": nba_data['url'],
-            "source_type": "nba_data",
-            "data_type": "basketball_statistics",
-            "timestamp": datetime.now().isoformat(),
-            "extraction_timestamp": nba_data['extraction_timestamp'],
-            "table_count": len(nba_data.get('tables', [])),
-            "chunk_count": len(content_chunks)
-        }
+        content_chunks, metadatas = build_nba_chunks(nba_data, custom_title, metadata)
+        add_chunks_to_knowledge_base(content_chunks, metadatas)
         
-        if metadata:
-            base_metadata.update(metadata)
-        
-        # Add chunks to vector store
-        metadatas = []
-        for i, chunk in enumerate(content_chunks):
-            chunk_metadata = base_metadata.copy()
-            chunk_metadata["chunk_id"] = i
-            chunk_metadata["chunk_type"] = "narrative" if i < len(narrative_chunks) else "table_summary" if i < len(narrative_chunks) + len(nba_data.get('tables', [])) else "insights"
-            metadatas.append(chunk_metadata)
-        
-        vectorstore.add_texts(content_chunks, metadatas=metadatas)
-        
-        return True, len(content_chunks), f"Successfully processed NBA data: {source_name}"
+        return True, len(content_chunks), f"Successfully processed NBA data: {metadatas[0]['source']}"
         
     except Exception as e:
         return False, 0, f"Error adding NBA data to knowledge base: {str(e)}"
@@ -2098,7 +2109,7 @@ def web_crawler_page():
         )
         
         if seed_option == "Recent Seasons (Recommended)":
-            seed_urls = get_basketball_reference_seed_urls()[:10]  # Limit for testing
+            seed_urls = list(itertools.islice(get_basketball_reference_seed_urls(), 10))  # Limit for testing
             st.info(f"🎯 Will start with {len(seed_urls)} recent NBA season URLs")
         elif seed_option == "Test URLs":
             seed_urls = [
@@ -2771,26 +2782,27 @@ def refresh_url_queue_data():
     except Exception as e:
         st.error(f"Error refreshing queue data: {str(e)}")
 
+# Ordered URL category rules, folded into one alternation so each URL is
+# classified with a single regex search (earlier rules win at the same position)
+_URL_CATEGORY_RULES = (
+    ('Season Stats', r'/leagues/NBA_\d{4}(?:_per_game|_totals|_advanced)?\.html'),
+    ('Team Pages', r'/teams/[A-Z]{3}/\d{4}\.html'),
+    ('Player Pages', r'/players/[a-z]/.*\.html'),
+    ('Playoff Data', r'/playoffs/NBA_\d{4}\.html'),
+    ('Awards', r'/awards/awards_\d{4}\.html'),
+    ('Draft', r'/draft/NBA_\d{4}\.html'),
+    ('Standings', r'/leagues/NBA_\d{4}_standings\.html'),
+)
+_URL_CATEGORY_RE = re.compile(
+    '|'.join(f'(?P<rule{i}>{pattern})' for i, (_, pattern) in enumerate(_URL_CATEGORY_RULES))
+)
+
 def categorize_url_by_pattern(url: str) -> str:
     """Categorize a URL based on its pattern"""
-    import re
-    
-    patterns = {
-        'Season Stats': r'/leagues/NBA_\d{4}(_per_game|_totals|_advanced)?\.html',
-        'Team Pages': r'/teams/[A-Z]{3}/\d{4}\.html',
-        'Player Pages': r'/players/[a-z]/.*\.html',
-        'Playoff Data': r'/playoffs/NBA_\d{4}\.html',
-        'Awards': r'/awards/awards_\d{4}\.html',
-        'Draft': r'/draft/NBA_\d{4}\.html',
-        'Standings': r'/leagues/NBA_\d{4}_standings\.html',
-        'Other': r'.*'
-    }
-    
-    for category, pattern in patterns.items():
-        if re.search(pattern, url):
-            return category
-    
-    return 'Unknown'
+    match = _URL_CATEGORY_RE.search(url)
+    if not match:
+        return 'Other'
+    return _URL_CATEGORY_RULES[int(match.lastgroup[4:])][0]
 
 def estimate_chunks_for_url(url: str) -> int:
     """Estimate the number of data chunks a URL might produce"""
@@ -47,6 +47,9 @@ Examples:
   # Resume previous crawl
   python run_crawler.py --resume
 
+  # Revisit archived pages, skipping the ones that have not changed
+  python run_crawler.py --recrawl
+
   # Show statistics only
   python run_crawler.py --stats
 
@@ -80,6 +83,11 @@ IMPORTANT: Basketball-Reference.com has a strict 20 pages/minute rate limit!
         action='store_true',
         help='Resume previous crawl from saved state'
     )
+    mode_group.add_argument(
+        '--recrawl', 
+        action='store_true',
+        help='Revisit pages from earlier crawls with conditional requests (unchanged pages are skipped)'
+    )
     mode_group.add_argument(
         '--stats', 
         action='store_true',
@@ -154,8 +162,8 @@ IMPORTANT: Basketball-Reference.com has a strict 20 pages/minute rate limit!
     # Handle test mode
     if args.test:
         print("🧪 Running test crawl...")
-        crawler = run_sample_crawl()
-        stats = crawler.get_crawl_statistics()
+        with run_sample_crawl() as crawler:
+            stats = crawler.get_crawl_statistics()
         print_results(stats, args.output)
         return
     
@@ -177,7 +185,7 @@ IMPORTANT: Basketball-Reference.com has a strict 20 pages/minute rate limit!
     
     elif args.comprehensive:
         seed_urls = get_basketball_reference_seed_urls()
-        print(f"🎯 Using comprehensive seed URL set ({len(seed_urls)} URLs)")
+        print("🎯 Using comprehensive seed URL set")
     
     elif args.recent_seasons:
         current_year = datetime.now().year
@@ -194,7 +202,7 @@ IMPORTANT: Basketball-Reference.com has a strict 20 pages/minute rate limit!
     else:
         # Default to comprehensive
         seed_urls = get_basketball_reference_seed_urls()
-        print(f"🎯 Using default comprehensive seed URL set ({len(seed_urls)} URLs)")
+        print("🎯 Using default comprehensive seed URL set")
     
     # Create crawler configuration
     if HAS_CONFIG_PRESETS and hasattr(args, 'config') and args.config:
@@ -233,6 +241,9 @@ IMPORTANT: Basketball-Reference.com has a strict 20 pages/minute rate limit!
     print(f"   Retry base delay: {config.retry_delay_base}s")
     print()
     
+    # Recrawls requeue finished pages instead of skipping them
+    config.recrawl = args.recrawl
+    
     # Warning for aggressive settings
     if config.delay_between_requests < 5.0 or config.max_concurrent_threads > 1:
         print("⚠️  WARNING: You're using aggressive settings that may trigger rate limiting!")
@@ -241,15 +252,17 @@ IMPORTANT: Basketball-Reference.com has a strict 20 pages/minute rate limit!
     
     # Initialize and run crawler
     try:
-        crawler = BasketballReferenceCrawler(config)
-        
-        if args.resume:
-            print("🔄 Resuming previous crawl...")
-            # Resume functionality would load existing state
-            stats = crawler.start_crawl()
-        else:
-            print("🚀 Starting new crawl...")
-            stats = crawler.start_crawl(seed_urls)
+        with BasketballReferenceCrawler(config) as crawler:
+            if args.resume:
+                print("🔄 Resuming previous crawl...")
+                # Resume functionality would load existing state
+                stats = crawler.start_crawl()
+            elif args.recrawl:
+                print("🔁 Re-crawling previously archived pages...")
+                stats = crawler.start_crawl()
+            else:
+                print("🚀 Starting new crawl...")
+                stats = crawler.start_crawl(seed_urls)
         
         print("\n✅ Crawl completed!")
         print_results(stats, args.output)
@@ -265,8 +278,8 @@ def show_statistics():
     """Show comprehensive crawler statistics"""
     try:
         # Initialize crawler to access statistics
-        crawler = BasketballReferenceCrawler()
-        stats = crawler.get_crawl_statistics()
+        with BasketballReferenceCrawler() as crawler:
+            stats = crawler.get_crawl_statistics()
         
         print("📊 Basketball-Reference Crawler Statistics")
         print("=" * 50)
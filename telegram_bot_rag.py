@@ -711,20 +711,18 @@ class AgentDaredevilBot:
 
 async def main():
     """Main function to run the bot."""
+    health_server = None
     try:
-        # Start health server in background thread for Railway
-        import threading
-        from health_server import start_health_server
+        # Serve Railway's /health endpoint from its own thread and loop, so
+        # blocking LLM / vector store calls on this loop can't stall it
+        from health_server import start_health_server_thread
         
         logger.info("🚀 Starting Agent Daredevil Bot...")
         
-        # Start health server first
-        health_thread = threading.Thread(target=start_health_server, daemon=True)
-        health_thread.start()
-        
-        # Give health server a moment to start
-        await asyncio.sleep(1)
-        logger.info("🏥 Health server started in background")
+        # Start health server first; it is listening once this returns
+        health_server = start_health_server_thread()
+        if health_server:
+            logger.info("🏥 Health server started")
         
         # Start the main bot
         bot = AgentDaredevilBot()
@@ -734,6 +732,9 @@ async def main():
     except Exception as e:
         logger.error(f"❌ Unexpected error: {e}")
         logger.error(traceback.format_exc())
+    finally:
+        if health_server:
+            health_server.stop()
 
 if __name__ == '__main__':
     asyncio.run(main())
@@ -0,0 +1,133 @@
+"""
+Recrawl mode: finished pages are requested again with their stored ETag and
+come back as 304 Not Modified without being archived a second time, or as a
+fresh 200 whose new ETag replaces the stored one.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+ETAG = '"v1"'
+PAGE = b"<html><head><title>NBA 2024</title></head><body><table><tr><td>1</td></tr></table></body></html>"
+
+
+class ConditionalHandler(BaseHTTPRequestHandler):
+    """Serves one page with an ETag and answers 304 when it is sent back"""
+    requests = []
+    etag = ETAG
+    page = PAGE
+
+    def do_GET(self):
+        if_none_match = self.headers.get('If-None-Match')
+        self.requests.append(if_none_match)
+        if if_none_match == self.etag:
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(self.page)))
+        self.send_header('ETag', self.etag)
+        self.end_headers()
+        self.wfile.write(self.page)
+
+    def log_message(self, *args):
+        pass
+
+
+def import_crawler():
+    """Import the crawler with the knowledge base (ChromaDB, embeddings) faked out"""
+    if 'rag_manager' not in sys.modules:
+        rag_manager = types.ModuleType('rag_manager')
+        for name in ('extract_nba_team_stats', 'add_nba_data_to_knowledge_base', 'build_nba_chunks',
+                     'add_chunks_to_knowledge_base', 'generate_nba_narrative', 'init_chromadb'):
+            setattr(rag_manager, name, lambda *args, **kwargs: None)
+        sys.modules['rag_manager'] = rag_manager
+    import basketball_reference_crawler
+    return basketball_reference_crawler
+
+
+class RecrawlTest(unittest.TestCase):
+
+    def setUp(self):
+        # The crawler keeps its database and logs in the working directory
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.addCleanup(self._restore_cwd)
+
+        ConditionalHandler.requests = []
+        ConditionalHandler.etag = ETAG
+        ConditionalHandler.page = PAGE
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), ConditionalHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/leagues/NBA_2024.html"
+
+        self.brc = import_crawler()
+
+    def _restore_cwd(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def make_crawler(self, recrawl):
+        config = self.brc.CrawlConfig(
+            base_domain=f"127.0.0.1:{self.server.server_port}",
+            max_pages=5,
+            delay_between_requests=0,
+            respect_robots_txt=False,
+            recrawl=recrawl,
+        )
+        crawler = self.brc.BasketballReferenceCrawler(config)
+        archived = []
+        crawler.archive_page = lambda url, content, page: archived.append(url) or 1
+        return crawler, archived
+
+    def url_row(self, crawler):
+        return crawler._exec("SELECT status, etag FROM urls WHERE url = ?", (self.url,))[0]
+
+    def test_recrawl_sends_stored_etag_and_handles_304(self):
+        with self.make_crawler(recrawl=False)[0] as crawler:
+            crawler.start_crawl([self.url])
+            self.assertEqual(self.url_row(crawler), ('completed', ETAG))
+
+        # A normal crawl never fetches a finished page again
+        with self.make_crawler(recrawl=False)[0] as crawler:
+            crawler.start_crawl()
+        self.assertEqual(ConditionalHandler.requests, [None])
+
+        crawler, archived = self.make_crawler(recrawl=True)
+        with crawler:
+            crawler.start_crawl()
+            self.assertEqual(ConditionalHandler.requests, [None, ETAG])
+            self.assertEqual(self.url_row(crawler), ('unchanged', ETAG))
+            self.assertEqual(archived, [])
+
+    def test_recrawl_stores_new_etag_when_page_changed(self):
+        with self.make_crawler(recrawl=False)[0] as crawler:
+            crawler.start_crawl([self.url])
+
+        ConditionalHandler.etag = '"v2"'
+        ConditionalHandler.page = PAGE.replace(b'<td>1</td>', b'<td>2</td>')
+
+        crawler, archived = self.make_crawler(recrawl=True)
+        with crawler:
+            crawler.start_crawl()
+            self.assertEqual(ConditionalHandler.requests, [None, ETAG])
+            self.assertEqual(self.url_row(crawler), ('completed', '"v2"'))
+            self.assertEqual(archived, [self.url])
+
+
+if __name__ == '__main__':
+    unittest.main()